@@ -3,24 +3,32 @@ import uvicorn
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from slowapi.middleware import SlowAPIASGIMiddleware
+from limits import parse as parse_rate_limit
 import redis.asyncio as redis
-import json
-import hashlib
+from redis.exceptions import NoScriptError
+import asyncio
+import xxhash
+from cachetools import TTLCache
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from known_sites.base_parsers import JobParserFactory
 from scanner import JobAnalyzer
-from schema import JobAnalysisResponse, JobPostingRequest
+from schema import (
+    JobAnalysisError, JobAnalysisResponse, JobPostingRequest, JobAnalysisBatchResponse, JobPostingBatchRequest
+)
 import logging
+import math
 import sys
 import os
 import time
-from typing import Optional
+from typing import Dict, List, Optional, Set, Union
 from site_searcher.site_finder import EnhancedCareerPageFinder
 
 load_dotenv()
@@ -41,46 +49,116 @@ SEARCH_ENGINE_ID = os.getenv("SEARCH_ENGINE_ID")
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 ALLOWED_HOSTS = os.getenv("ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+# Redis pool sizing: requests wait for a free connection once all
+# REDIS_MAX_CONNECTIONS are in use, so size it for the expected per-worker
+# concurrency. REDIS_WARM_CONNECTIONS are opened at startup.
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
+REDIS_WARM_CONNECTIONS = int(os.getenv("REDIS_WARM_CONNECTIONS", "8"))
 EXTENSION_ID = os.getenv("EXTENSION_ID", "none")
 
-# Rate limiting configuration
-limiter = Limiter(key_func=get_remote_address)
+# Lifetime of cached analyses; cache hits push the expiry back out
+CACHE_TTL = 3600
+
+# Read-and-refresh in one round trip: GET the key and, if present, extend its TTL
+CACHE_READ_SCRIPT = """
+local value = redis.call('GET', KEYS[1])
+if value then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return value
+"""
+
+# Career pages rarely move, so company -> career URL lookups are kept for a week
+CAREER_CACHE_TTL = 7 * 24 * 3600
+
+# Small per-process cache in front of Redis for identical requests arriving
+# close together (e.g. extension retries); entries are only trusted briefly
+LOCAL_CACHE_SIZE = 1024
+LOCAL_CACHE_TTL = 60
+
+# Postings shorter than this are rejected before reaching the NLP analyzer
+MIN_CONTENT_LENGTH = 200
+
+# Maximum number of postings accepted by /analyze/batch
+MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "20"))
+
+# Postings analyzed per minute per IP. /analyze and /analyze/batch draw on
+# the same bucket, a batch paying once per posting
+ANALYZE_RATE_LIMIT = "30/minute"
+ANALYZE_LIMIT_SCOPE = "analyze"
+analyze_rate_item = parse_rate_limit(ANALYZE_RATE_LIMIT)
+
+# Rate limiting configuration. Counters live in Redis so limits hold across
+# workers and replicas; the limits library runs its moving-window Lua script
+# via EVALSHA, one atomic round trip per check. If Redis is unreachable we
+# fall back to per-process in-memory counters rather than failing requests.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=REDIS_URL,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True
+)
 
 # Global variables for shared resources
 redis_client: Optional[redis.Redis] = None
+cache_read_sha: Optional[str] = None
 analyzer: Optional[JobAnalyzer] = None
 parser_factory: Optional[JobParserFactory] = None
 finder: Optional[EnhancedCareerPageFinder] = None
 
-async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    """Custom handler for rate limit exceeded errors"""
+local_cache: TTLCache = TTLCache(maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL)
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected mid-flight
+background_tasks: Set[asyncio.Task] = set()
+
+def rate_limit_response(detail: str, retry_after: Optional[int] = None) -> JSONResponse:
+    """The 429 body every rate-limited request gets"""
     return JSONResponse(
         status_code=429,
         content={
             "error": "Rate limit exceeded",
-            "detail": f"Rate limit exceeded: {exc.detail}",
-            "retry_after": getattr(exc, 'retry_after', None)
+            "detail": f"Rate limit exceeded: {detail}",
+            "retry_after": retry_after
         }
     )
 
+async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
+    """Custom handler for rate limit exceeded errors"""
+    return rate_limit_response(exc.detail, getattr(exc, 'retry_after', None))
+
 @asynccontextmanager
 async def lifespan(local_app: FastAPI):
     """Manage application startup and shutdown"""
-    global redis_client, analyzer, parser_factory, finder
+    global redis_client, cache_read_sha, parser_factory, finder
 
     logger.info("Starting up Job Posting Analyzer API...")
 
     # Initialize Redis connection
     try:
-        redis_client = redis.from_url(REDIS_URL, decode_responses=True)
+        # Cached values are JSON bytes served as-is, so skip the client-side str decoding.
+        # redis-py already sets TCP_NODELAY on every connection.
+        pool = redis.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            socket_keepalive=True,
+            socket_timeout=2,
+            health_check_interval=30,
+            decode_responses=False
+        )
+        redis_client = redis.Redis.from_pool(pool)
         await redis_client.ping()
+
+        # Open a few pooled connections up front so the first requests don't pay for the handshake
+        await asyncio.gather(*(redis_client.ping() for _ in range(REDIS_WARM_CONNECTIONS)))
+
+        # Loaded once and executed with EVALSHA; get_many_from_cache reloads it on NOSCRIPT
+        cache_read_sha = await redis_client.script_load(CACHE_READ_SCRIPT)
         logger.info("Redis connection established")
     except Exception as e:
         logger.error(f"Failed to connect to Redis: {e}")
         redis_client = None
 
-    # Initialize components
-    analyzer = JobAnalyzer()
+    # Initialize components; the NLP analyzer is created on first use
     parser_factory = JobParserFactory()
     finder = EnhancedCareerPageFinder(GOOGLE_API_KEY, SEARCH_ENGINE_ID)
 
@@ -90,6 +168,10 @@ async def lifespan(local_app: FastAPI):
 
     # Cleanup
     logger.info("Shutting down...")
+    if background_tasks:
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+    if finder:
+        await finder.aclose()
     if redis_client:
         await redis_client.close()
     logger.info("Shutdown complete")
@@ -123,134 +205,346 @@ if ENVIRONMENT == "production":
         allowed_hosts=ALLOWED_HOSTS
     )
 
-# Add rate limiting middleware (should be close to the app)
+# Add rate limiting middleware (should be close to the app). The ASGI variant,
+# since SlowAPIMiddleware is a BaseHTTPMiddleware (see TimingMiddleware below)
 app.state.limiter = limiter  # type: ignore[attr-defined]
 app.add_exception_handler(RateLimitExceeded, custom_rate_limit_handler)
-app.add_middleware(SlowAPIMiddleware)  # type: ignore
-
-# Custom middleware for request timing and logging
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-
-    # Log request details for monitoring
-    logger.info(
-        f"Request: {request.method} {request.url.path} "
-        f"- Status: {response.status_code} "
-        f"- Time: {process_time:.3f}s"
-    )
+app.add_middleware(SlowAPIASGIMiddleware)  # type: ignore
 
-    return response
+# Custom middleware for request timing and logging. Written as plain ASGI
+# rather than @app.middleware("http"), which wraps BaseHTTPMiddleware and
+# pushes every response through an extra task and memory stream.
+class TimingMiddleware:
+    """Add an X-Process-Time header and log each HTTP request"""
 
+    def __init__(self, local_app: ASGIApp):
+        self.app = local_app
 
-# Cache helper functions
-def generate_cache_key(content: str, url: str) -> str:
-    """Generate a cache key from content and URL"""
-    combined = f"{url}:{content}"
-    return f"job_analysis:{hashlib.md5(combined.encode()).hexdigest()}"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        start_time = time.perf_counter()
 
-async def get_from_cache(cache_key: str) -> Optional[dict]:
-    """Get analysis result from cache"""
-    if not redis_client:
-        return None
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{process_time:.6f}")
+
+                # Log request details for monitoring
+                logger.info(
+                    f"Request: {scope['method']} {scope['path']} "
+                    f"- Status: {message['status']} "
+                    f"- Time: {process_time:.3f}s"
+                )
+
+            await send(message)
 
+        await self.app(scope, receive, send_with_timing)
+
+
+app.add_middleware(TimingMiddleware)  # type: ignore
+
+
+# Cache helper functions
+def generate_cache_key(content: str, url: str) -> str:
+    """Generate a cache key from content and URL"""
+    # Stream the parts into the hasher instead of building a "url:content"
+    # copy of the (potentially large) posting body first
+    hasher = xxhash.xxh3_128()
+    hasher.update(url.encode())
+    hasher.update(b":")
+    hasher.update(content.encode())
+    return f"job_analysis:{hasher.hexdigest()}"
+
+
+async def get_many_from_cache(cache_keys: List[str]) -> List[Optional[bytes]]:
+    """Get serialized analysis results for several keys, checking the
+    in-process cache first and fetching the rest from Redis in a single round trip"""
+    results: List[Optional[bytes]] = [local_cache.get(cache_key) for cache_key in cache_keys]
+    missing = [i for i, cached in enumerate(results) if cached is None]
+    if not redis_client or not missing:
+        return results
+
+    global cache_read_sha
     try:
-        cached_data = await redis_client.get(cache_key)
-        if cached_data:
-            logger.info(f"Cache hit for key: {cache_key[:16]}...")
-            return json.loads(cached_data)
+        try:
+            cached_data = await read_cache_entries([cache_keys[i] for i in missing])
+        except NoScriptError:
+            # Redis lost its script cache (restart, SCRIPT FLUSH); load it again and retry once
+            cache_read_sha = await redis_client.script_load(CACHE_READ_SCRIPT)
+            cached_data = await read_cache_entries([cache_keys[i] for i in missing])
+
+        for i, data in zip(missing, cached_data):
+            if data:
+                logger.info(f"Cache hit for key: {cache_keys[i][:16]}...")
+                results[i] = local_cache[cache_keys[i]] = data
     except Exception as e:
         logger.error(f"Cache read error: {e}")
 
-    return None
+    return results
 
 
-async def set_cache(cache_key: str, data: dict, ttl: int = 3600) -> None:
-    """Store analysis result in cache"""
-    if not redis_client:
+async def read_cache_entries(cache_keys: List[str]) -> List[Optional[bytes]]:
+    """Read and refresh several keys with the cache read script, pipelined
+    into one round trip. Queued as plain EVALSHA commands: a registered
+    Script object on a pipeline makes execute() send SCRIPT EXISTS first"""
+    async with redis_client.pipeline(transaction=False) as pipe:
+        for cache_key in cache_keys:
+            pipe.evalsha(cache_read_sha, 1, cache_key, CACHE_TTL)
+        return await pipe.execute()
+
+
+async def set_many_cache(entries: Dict[str, bytes], ttl: int = CACHE_TTL) -> None:
+    """Store several serialized analysis results in the in-process cache
+    and in Redis in a single round trip"""
+    local_cache.update(entries)
+    if not redis_client or not entries:
         return
 
     try:
-        await redis_client.setex(
-            cache_key,
-            ttl,
-            json.dumps(data, default=str)
-        )
-        logger.info(f"Cached result for key: {cache_key[:16]}...")
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for cache_key, payload in entries.items():
+                pipe.setex(cache_key, ttl, payload)
+            await pipe.execute()
+        logger.info(f"Cached {len(entries)} result(s)")
     except Exception as e:
         logger.error(f"Cache write error: {e}")
 
 
+async def set_career_cache(career_key: str, career_url: str) -> None:
+    """Store a company's career page URL"""
+    try:
+        await redis_client.setex(career_key, CAREER_CACHE_TTL, career_url)
+    except Exception as e:
+        logger.error(f"Cache write error: {e}")
+
+
+async def find_career_url(company_name: str) -> Optional[str]:
+    """Find a company's career page URL, checking Redis before the (slow,
+    quota-limited) career page finder"""
+    career_key = f"career:{company_name.strip().lower()}"
+
+    if redis_client:
+        try:
+            cached_url = await redis_client.get(career_key)
+            if cached_url:
+                return cached_url.decode()
+        except Exception as e:
+            logger.error(f"Cache read error: {e}")
+
+    career_page_result = await finder.afind_career_page(company_name)
+    if not career_page_result:
+        return None
+
+    career_url = career_page_result['career_url']
+    if redis_client:
+        run_in_background(set_career_cache(career_key, career_url))
+    return career_url
+
+
+def get_analyzer() -> JobAnalyzer:
+    """Create the NLP analyzer on first use so parser-only traffic never pays for it"""
+    global analyzer
+    if analyzer is None:
+        analyzer = JobAnalyzer()
+    return analyzer
+
+
+def run_in_background(coro) -> None:
+    """Schedule a coroutine without awaiting it, keeping it alive until it finishes"""
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+
+
 # Dependency to get Redis client
 async def get_redis() -> Optional[redis.Redis]:
     return redis_client
 
 
+async def analyze_posting(job_request: JobPostingRequest) -> JobAnalysisResponse:
+    """Run the parser or NLP analyzer on a single posting and fill in missing details"""
+    parser = parser_factory.get_parser(job_request.url)
+    result = None
+
+    # Parsing and NLP are CPU-bound, so run them on a worker thread to keep
+    # the event loop free for other requests
+    if parser and job_request.rawHTML:
+        logger.info(f"Using format-specific parser for URL: {job_request.url}")
+        result = await asyncio.to_thread(parser.parse, job_request.rawHTML, job_request.url)
+    else:
+        logger.info(f"Using NLP analyzer for URL: {job_request.url}")
+        result = await asyncio.to_thread(get_analyzer().analyze, job_request.content, job_request.url)
+
+    if not result:
+        raise HTTPException(status_code=500, detail="Analysis failed")
+
+    # Enhance result with missing information
+    if not result.job_title and job_request.title:
+        result.job_title = job_request.title
+    if not result.company_name and job_request.companyGuess:
+        result.company_name = job_request.companyGuess
+
+    # Find company career page if missing
+    if not result.companyUrl and result.company_name:
+        try:
+            career_url = await find_career_url(result.company_name)
+            if career_url:
+                result.companyUrl = career_url
+        except Exception as e:
+            logger.warning(f"Failed to find career page: {e}")
+
+    logger.info(f"Analysis completed for URL: {job_request.url}")
+    return result
+
+
+def validate_posting(job_request: JobPostingRequest) -> Optional[HTTPException]:
+    """The error a posting is rejected with before analysis, if any"""
+    # isspace() answers the same question as strip() without copying the body
+    if not job_request.content or job_request.content.isspace():
+        return HTTPException(status_code=400, detail="Content cannot be empty")
+
+    # Without a format-specific parse the posting goes to the NLP analyzer,
+    # which has nothing useful to extract from a few words
+    # urlparse raises on malformed URLs such as an unclosed IPv6 bracket;
+    # that is this posting's error, not the whole batch's
+    try:
+        uses_parser = job_request.rawHTML and parser_factory.can_parse_format(job_request.url)
+    except ValueError:
+        return HTTPException(status_code=400, detail="Invalid URL")
+    if not uses_parser and len(job_request.content) < MIN_CONTENT_LENGTH:
+        return HTTPException(status_code=422, detail="Content too short")
+
+    return None
+
+
+async def analyze_postings(job_requests: List[JobPostingRequest]) -> List[Union[bytes, Exception]]:
+    """Analyze postings in order, sharing one cache read and one cache write
+    across the batch. Results are returned as serialized JSON, ready to be
+    both cached and sent to the client; a posting that is rejected or fails
+    to analyze gets its exception in its place instead, so one bad posting
+    doesn't sink the others."""
+    payloads: List[Union[bytes, Exception, None]] = [validate_posting(job_request) for job_request in job_requests]
+    valid = [i for i, error in enumerate(payloads) if error is None]
+
+    # Try to get everything from cache first
+    cache_keys = {i: generate_cache_key(job_requests[i].content, job_requests[i].url or "") for i in valid}
+    cached = await get_many_from_cache(list(cache_keys.values()))
+    misses = []
+    for i, payload in zip(valid, cached):
+        if payload:
+            payloads[i] = payload
+        else:
+            misses.append(i)
+
+    # Analyze the cache misses concurrently
+    analyzed = await asyncio.gather(*(analyze_posting(job_requests[i]) for i in misses), return_exceptions=True)
+
+    new_entries = {}
+    for i, result in zip(misses, analyzed):
+        if isinstance(result, Exception):
+            payloads[i] = result
+            continue
+        # Serialize once with pydantic's native encoder; the same bytes are
+        # cached and returned
+        payloads[i] = new_entries[cache_keys[i]] = result.model_dump_json().encode()
+
+    # Cache the new results without holding up the response;
+    # set_many_cache logs and drops its own errors
+    if new_entries:
+        run_in_background(set_many_cache(new_entries))
+
+    return payloads
+
+
+def charge_postings(request: Request, count: int) -> Optional[JSONResponse]:
+    """Charge count more postings to the caller's /analyze bucket, as a
+    batch has only been charged once by its decorator. Returns the 429 to
+    send if they don't fit, in which case nothing more is charged."""
+    if count <= 0:
+        return None
+    key = get_remote_address(request)
+    try:
+        if limiter.limiter.hit(analyze_rate_item, key, ANALYZE_LIMIT_SCOPE, cost=count):
+            return None
+        reset_time, _ = limiter.limiter.get_window_stats(analyze_rate_item, key, ANALYZE_LIMIT_SCOPE)
+    except Exception as e:
+        # Same stance as the limiter's own fallback: don't fail requests over it
+        logger.error(f"Rate limit storage error: {e}")
+        return None
+    return rate_limit_response(str(analyze_rate_item), max(0, math.ceil(reset_time - time.time())))
+
+
+def batch_item_payload(result: Union[bytes, Exception]) -> bytes:
+    """A batch entry: the serialized analysis, or the error it failed with"""
+    if isinstance(result, bytes):
+        return result
+    if isinstance(result, HTTPException):
+        error = JobAnalysisError(status_code=result.status_code, error=str(result.detail))
+    else:
+        logger.error(f"Batch analysis failed: {str(result)}", exc_info=result)
+        error = JobAnalysisError(status_code=500, error=f"Analysis failed: {str(result)}")
+    return error.model_dump_json().encode()
+
+
 @app.post("/analyze", response_model=JobAnalysisResponse)
-@limiter.limit("30/minute")  # Rate limit: 30 requests per minute per IP
+@limiter.shared_limit(ANALYZE_RATE_LIMIT, scope=ANALYZE_LIMIT_SCOPE)
 async def analyze_job_posting(
         request: Request,
         job_request: JobPostingRequest
 ):
     """Analyze job posting content and extract key information"""
     try:
-        if not job_request.content.strip():
-            raise HTTPException(status_code=400, detail="Content cannot be empty")
-
-        # Generate cache key
-        cache_key = generate_cache_key(job_request.content, job_request.url or "")
+        # Return the serialized result as-is rather than letting FastAPI
+        # validate and encode the response model a second time
+        payload = (await analyze_postings([job_request]))[0]
+        if isinstance(payload, Exception):
+            raise payload
+        return Response(content=payload, media_type="application/json")
 
-        # Try to get from cache first
-        cached_result = await get_from_cache(cache_key)
-        if cached_result:
-            return JobAnalysisResponse(**cached_result)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
-        # Proceed with analysis
-        parser = parser_factory.get_parser(job_request.url)
-        result = None
 
-        if parser and job_request.rawHTML:
-            logger.info(f"Using format-specific parser for URL: {job_request.url}")
-            result = parser.parse(job_request.rawHTML, job_request.url)
-        else:
-            logger.info(f"Using NLP analyzer for URL: {job_request.url}")
-            result = analyzer.analyze(job_request.content, job_request.url)
-
-        if not result:
-            raise HTTPException(status_code=500, detail="Analysis failed")
-
-        # Enhance result with missing information
-        if not result.job_title and job_request.title:
-            result.job_title = job_request.title
-        if not result.company_name and job_request.companyGuess:
-            result.company_name = job_request.companyGuess
-
-        # Find company career page if missing
-        if not result.companyUrl and result.company_name:
-            try:
-                career_page_result = finder.find_career_page(result.company_name)
-                if career_page_result:
-                    result.companyUrl = career_page_result['career_url']
-            except Exception as e:
-                logger.warning(f"Failed to find career page: {e}")
-
-        # Convert result to dict for caching
-        result_dict = result.model_dump() if hasattr(result, 'dict') else result.__dict__
-
-        # Cache the result (1 hour TTL)
-        await set_cache(cache_key, result_dict, ttl=3600)
-
-        logger.info(f"Analysis completed for URL: {job_request.url}")
-        return result
+@app.post("/analyze/batch", response_model=JobAnalysisBatchResponse)
+@limiter.shared_limit(ANALYZE_RATE_LIMIT, scope=ANALYZE_LIMIT_SCOPE)
+@limiter.limit("10/minute")
+async def analyze_job_postings_batch(
+        request: Request,
+        batch_request: JobPostingBatchRequest
+):
+    """Analyze several job postings in one request"""
+    try:
+        if not batch_request.postings:
+            raise HTTPException(status_code=400, detail="Batch cannot be empty")
+        if len(batch_request.postings) > MAX_BATCH_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Batch cannot contain more than {MAX_BATCH_SIZE} postings"
+            )
+
+        # The decorator charged the first posting. A refused batch keeps that
+        # unit spent, as the limits storage can't hand a hit back
+        refusal = charge_postings(request, len(batch_request.postings) - 1)
+        if refusal is not None:
+            return refusal
+
+        payloads = await analyze_postings(batch_request.postings)
+        return Response(
+            content=b'{"results":[' + b",".join(map(batch_item_payload, payloads)) + b"]}",
+            media_type="application/json"
+        )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Analysis failed: {str(e)}", exc_info=True)
+        logger.error(f"Batch analysis failed: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
@@ -318,6 +612,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "analyze": "/analyze (POST)",
+            "analyze_batch": "/analyze/batch (POST)",
             "health": "/health (GET)",
             "docs": "/docs (GET)"
         }
@@ -325,4 +620,13 @@ async def root():
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # The import string form is required for multiple workers. loop="auto"
+    # picks uvloop when it is installed (it is unavailable on Windows).
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    )
\ No newline at end of file
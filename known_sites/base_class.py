@@ -1,13 +1,29 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple, Union
+from urllib.parse import urlparse
 from schema import JobAnalysisResponse
 
+
+@lru_cache(maxsize=8192)
+def url_host(url: str) -> str:
+    """Get the lowercased host of a URL ('' if it has none), memoized since
+    the same URLs are checked by the factory and the parsers"""
+    return urlparse(url).hostname or ''
+
+
 class JobSiteParser:
     """Base class for job site parsers"""
 
+    # Registered domains (matched against the URL host and its parent domains)
+    DOMAINS: Tuple[str, ...] = ()
+
     def can_parse(self, url: str) -> bool:
         """Check if this parser can handle the given URL"""
-        raise NotImplementedError
+        if not url:
+            return False
+        host = url_host(url)
+        return any(host == domain or host.endswith('.' + domain) for domain in self.DOMAINS)
 
-    def parse(self, content: str, url: Optional[str] = None) -> JobAnalysisResponse:
-        """Parse job posting content into structured data"""
+    def parse(self, content: Union[str, bytes], url: Optional[str] = None) -> JobAnalysisResponse:
+        """Parse job posting HTML (str, or UTF-8 encoded bytes) into structured data"""
         raise NotImplementedError
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import Optional
-from known_sites.base_class import JobSiteParser
+from functools import lru_cache
+from typing import Dict, Optional
+from known_sites.base_class import JobSiteParser, url_host
 from known_sites.linkedin import LinkedInParser
 from known_sites.indeed import IndeedParser
 
@@ -13,16 +14,33 @@ class JobParserFactory:
             # Add more parsers here
         ]
 
+        # Dispatch table built from each parser's registered domains
+        self._domain_map: Dict[str, JobSiteParser] = {
+            domain: parser
+            for parser in self.parsers
+            for domain in parser.DOMAINS
+        }
+        self._parser_for_host = lru_cache(maxsize=4096)(self._lookup_host)
+
+    def _lookup_host(self, host: str) -> Optional[JobSiteParser]:
+        """Find the parser registered for a host or any of its parent domains"""
+        labels = host.split('.')
+        for i in range(len(labels) - 1):
+            parser = self._domain_map.get('.'.join(labels[i:]))
+            if parser:
+                return parser
+        return None
+
     def get_parser(self, url: Optional[str]) -> Optional[JobSiteParser]:
         """Get the appropriate parser for the given URL"""
         if not url:
             return None
 
-        for parser in self.parsers:
-            if parser.can_parse(url):
-                return parser
+        host = url_host(url)
+        if not host:
+            return None
 
-        return None
+        return self._parser_for_host(host)
 
     def can_parse_format(self, url: Optional[str]) -> bool:
         """Check if we have a parser for this URL"""
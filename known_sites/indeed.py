@@ -1,55 +1,68 @@
-from typing import List, Optional
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-import re
+from typing import Dict, List, Optional, Union
+from selectolax.lexbor import LexborHTMLParser
 from schema import JobAnalysisResponse, Skill
 from known_sites.base_class import JobSiteParser
+from known_sites.keywords import (
+    COMMON_KEYWORDS, EMPLOYMENT_TYPES, EXPERIENCE_LEVELS, JOB_KEYWORDS, TECH_SKILLS, Hits, skill_years
+)
+
+# Header fields keyed by data-testid; fetched together in one selector pass
+_HEADER_FIELDS = {
+    'jobsearch-JobInfoHeader-title': 'job_title',
+    'inlineHeader-companyName': 'company_name',
+    'job-location': 'location',
+    'attribute_snippet_testid': 'salary',
+}
+
+_HEADER_SELECTOR = (
+    'h1[data-testid="jobsearch-JobInfoHeader-title"], '
+    '[data-testid="inlineHeader-companyName"], '
+    '[data-testid="job-location"], '
+    '[data-testid="attribute_snippet_testid"]'
+)
+
 
 class IndeedParser(JobSiteParser):
     """Parser for Indeed job postings"""
 
-    def can_parse(self, url: str) -> bool:
-        if not url:
-            return False
-        domain = urlparse(url).netloc.lower()
-        return 'indeed.com' in domain
+    DOMAINS = ('indeed.com',)
 
-    def parse(self, content: str, url: Optional[str] = None) -> JobAnalysisResponse:
-        soup = BeautifulSoup(content, 'html.parser')
+    def parse(self, content: Union[str, bytes], url: Optional[str] = None) -> JobAnalysisResponse:
+        # lexbor takes the str rawHTML from the API as well as UTF-8 bytes
+        tree = LexborHTMLParser(content)
 
-        # Extract job title
-        job_title_element = soup.select_one('h1[data-testid="jobsearch-JobInfoHeader-title"]')
-        job_title = job_title_element.get_text(strip=True) if job_title_element else None
+        # Extract job title, company name, location and salary
+        header = self._extract_header_fields(tree)
 
-        # Extract company name
-        company_element = soup.select_one('[data-testid="inlineHeader-companyName"]')
-        company_name = company_element.get_text(strip=True) if company_element else None
+        # Extract job description for skills and keywords; lowercased once and
+        # shared by every text extractor below
+        description_element = tree.css_first('#jobDescriptionText, .jobsearch-jobDescriptionText')
+        description_text = description_element.text().lower() if description_element else ""
 
-        # Extract job description for skills and keywords
-        description_element = soup.select_one('#jobDescriptionText, .jobsearch-jobDescriptionText')
-        description_text = description_element.get_text().lower() if description_element else ""
+        # Single pass over the description shared by all text extractors
+        hits = JOB_KEYWORDS.scan(description_text)
 
         # Extract skills (similar logic to LinkedIn)
-        skills = self._extract_skills_from_text(description_text)
+        skills = self._extract_skills_from_text(description_text, hits)
 
         # Extract experience level
-        experience_level = self._extract_experience_from_text(description_text)
+        experience_level = self._extract_experience_from_text(hits)
 
         # Extract keywords
-        keywords = self._extract_keywords_from_text(description_text)
+        keywords = self._extract_keywords_from_text(hits)
 
         # Additional details
         additional_details = {
-            "location": self._extract_location(soup),
-            "salary": self._extract_salary(soup),
-            "employment_type": self._extract_employment_type_from_text(description_text)
+            "location": header['location'],
+            "salary": header['salary'],
+            "employment_type": self._extract_employment_type_from_text(hits)
         }
 
         return JobAnalysisResponse(
             success=True,
-            company_name=company_name,
+            company_name=header['company_name'],
             companyUrl=None,
-            job_title=job_title,
+            job_title=header['job_title'],
             keywords=keywords,
             skills=skills,
             experience_level=experience_level,
@@ -57,62 +70,45 @@ class IndeedParser(JobSiteParser):
             confidence_scores={"parsing": 0.95}
         )
 
-    def _extract_skills_from_text(self, text: str) -> List[Skill]:
+    def _extract_skills_from_text(self, text: str, hits: Hits) -> List[Skill]:
         # Similar to LinkedIn parser but adapted for Indeed's format
-        skills = []
-        tech_skills = [
-            'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes',
-            'aws', 'azure', 'gcp', 'git', 'jenkins', 'ci/cd', 'rest api', 'graphql'
+        found_skills = hits['skill']
+
+        # The required check doesn't depend on the skill, so run it once
+        is_required = bool(hits['required'])
+
+        names = [skill for skill in TECH_SKILLS if skill in found_skills]
+        years = [skill_years(text, skill, found_skills[skill]) for skill in names]
+
+        # Built without validation, the values above already have the field types
+        return [
+            Skill.model_construct(name=skill.title(), years_experience=years_exp, is_required=is_required)
+            for skill, years_exp in zip(names, years)
         ]
 
-        for skill in tech_skills:
-            if skill in text:
-                years_pattern = rf'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience\s*)?(?:with\s*|in\s*)?{re.escape(skill)}'
-                years_match = re.search(years_pattern, text, re.IGNORECASE)
-                years_exp = years_match.group(1) + "+ years" if years_match else None
-
-                is_required = any(req_word in text for req_word in ['required', 'must have', 'essential'])
-
-                skills.append(Skill(
-                    name=skill.title(),
-                    years_experience=years_exp,
-                    is_required=is_required
-                ))
-
-        return skills
-
-    def _extract_experience_from_text(self, text: str) -> Optional[str]:
-        if any(word in text for word in ['senior', 'sr.', 'lead', 'principal']):
-            return "Senior"
-        elif any(word in text for word in ['junior', 'jr.', 'entry level', 'graduate']):
-            return "Junior"
-        elif any(word in text for word in ['mid-level', 'intermediate', '3-5 years']):
-            return "Mid-Level"
+    def _extract_experience_from_text(self, hits: Hits) -> Optional[str]:
+        for level, _ in EXPERIENCE_LEVELS:
+            if hits[level]:
+                return level
         return "Not specified"
 
-    def _extract_keywords_from_text(self, text: str) -> List[str]:
-        common_keywords = [
-            'remote', 'hybrid', 'full-time', 'part-time', 'contract',
-            'startup', 'enterprise', 'agile', 'scrum', 'team lead'
-        ]
-        return [keyword for keyword in common_keywords if keyword.lower() in text]
-
-    def _extract_location(self, soup: BeautifulSoup) -> Optional[str]:
-        location_element = soup.select_one('[data-testid="job-location"]')
-        return location_element.get_text(strip=True) if location_element else None
-
-    def _extract_salary(self, soup: BeautifulSoup) -> Optional[str]:
-        salary_element = soup.select_one('[data-testid="attribute_snippet_testid"]')
-        return salary_element.get_text(strip=True) if salary_element else None
-
-    def _extract_employment_type_from_text(self, text: str) -> Optional[str]:
-        if 'full-time' in text:
-            return "Full-time"
-        elif 'part-time' in text:
-            return "Part-time"
-        elif 'contract' in text:
-            return "Contract"
-        elif 'internship' in text:
-            return "Internship"
+    def _extract_keywords_from_text(self, hits: Hits) -> List[str]:
+        found_keywords = hits['keyword']
+        return [keyword for keyword in COMMON_KEYWORDS if keyword in found_keywords]
+
+    def _extract_header_fields(self, tree: LexborHTMLParser) -> Dict[str, Optional[str]]:
+        """Collect the data-testid header fields with a single DOM walk,
+        keeping the first element in document order for each field"""
+        fields: Dict[str, Optional[str]] = dict.fromkeys(_HEADER_FIELDS.values())
+        for element in tree.css(_HEADER_SELECTOR):
+            field = _HEADER_FIELDS[element.attributes['data-testid']]
+            if fields[field] is None:
+                fields[field] = element.text(strip=True)
+        return fields
+
+    def _extract_employment_type_from_text(self, hits: Hits) -> Optional[str]:
+        found_types = hits['employment']
+        for needle, employment_type in EMPLOYMENT_TYPES:
+            if needle in found_types:
+                return employment_type
         return None
\ No newline at end of file
@@ -0,0 +1,108 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+import ahocorasick
+import re
+
+# Keyword tables shared by the site parsers; all lowercase, since the
+# parsers lowercase the text once before scanning it
+TECH_SKILLS = (
+    'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
+    'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes',
+    'aws', 'azure', 'gcp', 'git', 'jenkins', 'ci/cd', 'rest api', 'graphql'
+)
+
+REQUIRED_WORDS = ('required', 'must have', 'essential')
+
+COMMON_KEYWORDS = (
+    'remote', 'hybrid', 'full-time', 'part-time', 'contract',
+    'startup', 'enterprise', 'agile', 'scrum', 'team lead'
+)
+
+# Checked in order, first level with a hit wins
+EXPERIENCE_LEVELS = (
+    ("Senior", ('senior', 'sr.', 'lead', 'principal')),
+    ("Junior", ('junior', 'jr.', 'entry level', 'graduate')),
+    ("Mid-Level", ('mid-level', 'intermediate', '3-5 years')),
+)
+
+EMPLOYMENT_TYPES = (
+    ('full-time', "Full-time"),
+    ('part-time', "Part-time"),
+    ('contract', "Contract"),
+    ('internship', "Internship"),
+)
+
+# Years of experience stated right before a skill ("5+ years of python").
+# (?<!\d) keeps a search started mid-number from matching its tail
+SKILL_YEARS_RES = {
+    skill: re.compile(
+        rf'(?<!\d)(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience\s*)?(?:with\s*|in\s*)?{re.escape(skill)}'
+    )
+    for skill in TECH_SKILLS
+}
+
+# How far before a skill mention the years pattern is looked for
+YEARS_WINDOW = 100
+
+# tag -> needle -> start offsets of each occurrence, in text order
+Hits = Dict[str, Dict[str, List[int]]]
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over groups of needles, so a text is scanned
+    once for all of them instead of once per needle"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        tags: Dict[str, List[str]] = defaultdict(list)
+        for tag, needles in groups.items():
+            for needle in needles:
+                tags[needle].append(tag)
+
+        self._automaton = ahocorasick.Automaton()
+        for needle, needle_tags in tags.items():
+            self._automaton.add_word(needle, (needle, tuple(needle_tags)))
+        self._automaton.make_automaton()
+
+    def scan(self, text: str) -> Hits:
+        """Return every needle found in text, grouped by tag, with the
+        offsets it was found at"""
+        hits: Hits = defaultdict(dict)
+        for end, (needle, tags) in self._automaton.iter(text):
+            start = end - len(needle) + 1
+            for tag in tags:
+                hits[tag].setdefault(needle, []).append(start)
+        return hits
+
+
+def _groups() -> Dict[str, List[str]]:
+    groups = {
+        'skill': list(TECH_SKILLS),
+        'required': list(REQUIRED_WORDS),
+        'keyword': list(COMMON_KEYWORDS),
+        'employment': [needle for needle, _ in EMPLOYMENT_TYPES],
+    }
+    for level, words in EXPERIENCE_LEVELS:
+        groups[level] = list(words)
+    return groups
+
+
+JOB_KEYWORDS = KeywordMatcher(_groups())
+
+# Just the experience-level and employment-type needles, for sweeping a
+# whole page where only those two classifications are needed
+PAGE_KEYWORDS = KeywordMatcher({
+    **{level: words for level, words in EXPERIENCE_LEVELS},
+    'employment': [needle for needle, _ in EMPLOYMENT_TYPES],
+})
+
+
+def skill_years(text: str, skill: str, starts: List[int]) -> Optional[str]:
+    """Years of experience stated for a skill, looked for only in a short
+    window before each place the scan found the skill"""
+    pattern = SKILL_YEARS_RES[skill]
+    end_offset = len(skill)
+    for start in starts:
+        match = pattern.search(text, max(0, start - YEARS_WINDOW), start + end_offset)
+        if match:
+            return match.group(1) + "+ years"
+    return None
@@ -1,44 +1,142 @@
-import json
-from typing import List, Optional
-from urllib.parse import urlparse
-from bs4 import BeautifulSoup
+import orjson
+from typing import List, Optional, Tuple, Union
+from selectolax.lexbor import LexborHTMLParser
 import re
 from schema import JobAnalysisResponse, Skill
 from known_sites.base_class import JobSiteParser
+from known_sites.keywords import (
+    COMMON_KEYWORDS, EMPLOYMENT_TYPES, EXPERIENCE_LEVELS, JOB_KEYWORDS, PAGE_KEYWORDS, TECH_SKILLS, Hits, skill_years
+)
+
+# Either class marks the job description container
+_DESCRIPTION_SELECTOR = '.jobs-box__html-content, .job-details-jobs-unified-top-card__job-description'
+
+# Selector lists tried in priority order, one query per selector
+_JOB_TITLE_SELECTORS = (
+    'h1.top-card-layout__title',
+    '.job-details-jobs-unified-top-card__job-title h1',
+    '.jobs-unified-top-card__job-title h1'
+)
+
+_LOCATION_SELECTORS = (
+    '.job-details-jobs-unified-top-card__bullet',
+    '.jobs-unified-top-card__bullet'
+)
+
+# Updated company name selectors for 2024/2025
+_COMPANY_SELECTORS = (
+    # New LinkedIn job page selectors
+    '[data-test-id="job-details-header-company-name"]',
+    '[data-test-id="company-name"]',
+    '.job-details-jobs-unified-top-card__company-name a',
+    '.jobs-unified-top-card__company-name a',
+    '.jobs-unified-top-card__company-name',
+    '.job-details__company-link',
+    '.jobs-company-name',
+
+    # Alternative selectors
+    '[data-tracking-control-name="public_jobs_topcard-org-name"]',
+    '[data-tracking-control-name="public_jobs_topcard_org_name"]',
+    '.topcard__org-name-redirect',
+    '.job-details-jobs-unified-top-card__primary-description-container a',
+
+    # Generic fallbacks
+    '[class*="company-name"]',
+    '[class*="employer-name"]',
+    '[data-test*="company"]',
+    '[data-testid*="company"]'
+)
+
+_META_SELECTORS = (
+    'meta[property="og:site_name"]',
+    'meta[name="author"]',
+    'meta[property="article:author"]',
+    'meta[name="company"]',
+    'meta[property="og:title"]'
+)
+
+# Common patterns in LinkedIn JSON-LD, split into keys once
+_COMPANY_PATHS = tuple(tuple(path.split('.')) for path in [
+    'hiringOrganization.name',
+    'hiringOrganization.legalName',
+    'employmentType.hiringOrganization.name',
+    'publisher.name',
+    'author.name',
+    'organization.name',
+    'company.name',
+    'employer.name'
+])
+
+# Quoted JSON keys the company lookups start from; a JSON-LD blob containing
+# none of them (breadcrumbs, SearchAction...) can't yield a company, so it
+# isn't decoded at all
+_JSON_LD_KEYS = (
+    '"hiringOrganization"', '"publisher"', '"author"', '"organization"',
+    '"company"', '"companyName"', '"employer"'
+)
+
+# Suffixes stripped from meta tag content
+_META_STRIP_RES = (
+    re.compile(r'\s*\|\s*LinkedIn.*$'),
+    re.compile(r'\s*-\s*LinkedIn.*$'),
+)
+
+# LinkedIn page titles often follow: "Job Title - Company Name | LinkedIn"
+_TITLE_LINKEDIN_RE = re.compile(r'-\s*([^|]+?)\s*\|\s*LinkedIn')
+
+_TEXT_PATTERN_RES = [re.compile(p) for p in [
+    r'(?i)company:\s*([^\n\r,]+)',
+    r'(?i)employer:\s*([^\n\r,]+)',
+    r'(?i)organization:\s*([^\n\r,]+)',
+    r'(?i)hiring\s+company:\s*([^\n\r,]+)'
+]]
+
 
 class LinkedInParser(JobSiteParser):
     """Parser for LinkedIn job postings"""
 
-    def can_parse(self, url: str) -> bool:
-        if not url:
-            return False
-        domain = urlparse(url).netloc.lower()
-        return 'linkedin.com' in domain
+    DOMAINS = ('linkedin.com',)
+
+    def parse(self, content: Union[str, bytes], url: Optional[str] = None) -> JobAnalysisResponse:
+        # lexbor takes the str rawHTML from the API as well as UTF-8 bytes
+        # (same as the Indeed parser)
+        tree = LexborHTMLParser(content)
+
+        # JSON-LD bodies are read before script and style are stripped, so
+        # the root text afterwards is just the visible page text
+        json_ld = [script.text() for script in tree.css('script[type="application/ld+json"]')]
+        tree.strip_tags(['script', 'style'])
+
+        # The page text and the description are each extracted, lowercased and
+        # swept for keywords once, then shared by the extractors below
+        page_text = tree.root.text() if tree.root else ""
+        page_hits = PAGE_KEYWORDS.scan(page_text.lower())
 
-    def parse(self, content: str, url: Optional[str] = None) -> JobAnalysisResponse:
-        soup = BeautifulSoup(content, 'html.parser')
+        description = tree.css_first(_DESCRIPTION_SELECTOR)
+        description_text = description.text().lower() if description else ""
+        description_hits = JOB_KEYWORDS.scan(description_text)
 
         # Extract job title
-        job_title = self._extract_job_title(soup)
+        job_title = self._extract_job_title(tree)
 
         # Extract company name
-        company_name = self._extract_company_name(soup)
+        company_name = self._extract_company_name(tree, json_ld, page_text)
 
         # Extract skills and requirements
-        skills = self._extract_skills(soup)
+        skills = self._extract_skills(description_text, description_hits)
 
         # Extract experience level
-        experience_level = self._extract_experience_level(soup)
+        experience_level = self._extract_experience_level(page_hits)
 
         # Extract keywords
-        keywords = self._extract_keywords(soup)
+        keywords = self._extract_keywords(description_hits)
 
         # Additional details
         additional_details = {
-            "location": self._extract_location(soup),
-            "employment_type": self._extract_employment_type(soup),
-            "seniority_level": self._extract_seniority_level(soup),
-            "company_size": self._extract_company_size(soup)
+            "location": self._extract_location(tree),
+            "employment_type": self._extract_employment_type(page_hits),
+            "seniority_level": self._extract_seniority_level(tree),
+            "company_size": self._extract_company_size(tree)
         }
 
         return JobAnalysisResponse(
@@ -53,21 +151,15 @@ class LinkedInParser(JobSiteParser):
             confidence_scores={"parsing": 0.95}  # High confidence for structured parsing
         )
 
-    def _extract_job_title(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_job_title(self, tree: LexborHTMLParser) -> Optional[str]:
         # LinkedIn job title selectors
-        selectors = [
-            'h1.top-card-layout__title',
-            '.job-details-jobs-unified-top-card__job-title h1',
-            '.jobs-unified-top-card__job-title h1'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
+        for selector in _JOB_TITLE_SELECTORS:
+            element = tree.css_first(selector)
             if element:
-                return element.get_text(strip=True)
+                return element.text(strip=True)
         return None
 
-    # def _extract_company_name(self, soup: BeautifulSoup) -> Optional[str]:
+    # def _extract_company_name(self, tree: LexborHTMLParser) -> Optional[str]:
     #     selectors = [
     #         '.job-details-jobs-unified-top-card__company-name a',
     #         '.jobs-unified-top-card__company-name a',
@@ -76,153 +168,107 @@ class LinkedInParser(JobSiteParser):
     #     ]
     #
     #     for selector in selectors:
-    #         element = soup.select_one(selector)
+    #         element = tree.css_first(selector)
     #         if element:
-    #             return element.get_text(strip=True)
+    #             return element.text(strip=True)
     #     return None
 
-    def _extract_skills(self, soup: BeautifulSoup) -> List[Skill]:
-        skills = []
+    def _extract_skills(self, text: str, hits: Hits) -> List[Skill]:
+        # The description sweep found every skill and required word along with
+        # where they occur; the years pattern only runs next to each skill mention
+        found_skills = hits['skill']
 
-        # Look for skills in job description
-        description = soup.select_one('.jobs-box__html-content, .job-details-jobs-unified-top-card__job-description')
-        if not description:
-            return skills
+        # Check if it's required (look for "required", "must have", etc.)
+        is_required = bool(hits['required'])
 
-        text = description.get_text().lower()
+        names = [skill for skill in TECH_SKILLS if skill in found_skills]
+        years = [skill_years(text, skill, found_skills[skill]) for skill in names]
 
-        # Common tech skills to look for
-        tech_skills = [
-            'python', 'javascript', 'java', 'react', 'angular', 'vue', 'node.js',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes',
-            'aws', 'azure', 'gcp', 'git', 'jenkins', 'ci/cd', 'rest api', 'graphql'
+        # Built without validation, the values above already have the field types
+        return [
+            Skill.model_construct(name=skill.title(), years_experience=years_exp, is_required=is_required)
+            for skill, years_exp in zip(names, years)
         ]
 
-        for skill in tech_skills:
-            if skill in text:
-                # Try to extract years of experience
-                years_pattern = rf'(\d+)\+?\s*years?\s*(?:of\s*)?(?:experience\s*)?(?:with\s*|in\s*)?{re.escape(skill)}'
-                years_match = re.search(years_pattern, text, re.IGNORECASE)
-                years_exp = years_match.group(1) + "+ years" if years_match else None
-
-                # Check if it's required (look for "required", "must have", etc.)
-                is_required = any(req_word in text for req_word in ['required', 'must have', 'essential'])
-
-                skills.append(Skill(
-                    name=skill.title(),
-                    years_experience=years_exp,
-                    is_required=is_required
-                ))
-
-        return skills
-
-    def _extract_experience_level(self, soup: BeautifulSoup) -> Optional[str]:
-        # Look for seniority level indicators
-        text = soup.get_text().lower()
-
-        if any(word in text for word in ['senior', 'sr.', 'lead', 'principal']):
-            return "Senior"
-        elif any(word in text for word in ['junior', 'jr.', 'entry level', 'graduate']):
-            return "Junior"
-        elif any(word in text for word in ['mid-level', 'intermediate', '3-5 years']):
-            return "Mid-Level"
-
+    def _extract_experience_level(self, hits: Hits) -> Optional[str]:
+        # Look for seniority level indicators found on the page, in priority order
+        for level, _ in EXPERIENCE_LEVELS:
+            if hits[level]:
+                return level
         return "Not specified"
 
-    def _extract_keywords(self, soup: BeautifulSoup) -> List[str]:
-        # Extract key terms from job description
-        description = soup.select_one('.jobs-box__html-content, .job-details-jobs-unified-top-card__job-description')
-        if not description:
-            return []
-
-        text = description.get_text()
+    def _extract_keywords(self, hits: Hits) -> List[str]:
+        # Key terms from the job description sweep
         # Simple keyword extraction - you can make this more sophisticated
-        common_keywords = [
-            'remote', 'hybrid', 'full-time', 'part-time', 'contract',
-            'startup', 'enterprise', 'agile', 'scrum', 'team lead'
-        ]
-
-        return [keyword for keyword in common_keywords if keyword.lower() in text.lower()]
+        found_keywords = hits['keyword']
+        return [keyword for keyword in COMMON_KEYWORDS if keyword in found_keywords]
 
-    def _extract_location(self, soup: BeautifulSoup) -> Optional[str]:
-        selectors = [
-            '.job-details-jobs-unified-top-card__bullet',
-            '.jobs-unified-top-card__bullet'
-        ]
-
-        for selector in selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                text = element.get_text(strip=True)
+    def _extract_location(self, tree: LexborHTMLParser) -> Optional[str]:
+        for selector in _LOCATION_SELECTORS:
+            for element in tree.css(selector):
+                text = element.text(strip=True)
                 if any(word in text.lower() for word in ['remote', 'hybrid']) or ',' in text:
                     return text
         return None
 
-    def _extract_employment_type(self, soup: BeautifulSoup) -> Optional[str]:
-        text = soup.get_text().lower()
-        if 'full-time' in text:
-            return "Full-time"
-        elif 'part-time' in text:
-            return "Part-time"
-        elif 'contract' in text:
-            return "Contract"
-        elif 'internship' in text:
-            return "Internship"
+    def _extract_employment_type(self, hits: Hits) -> Optional[str]:
+        found_types = hits['employment']
+        for needle, employment_type in EMPLOYMENT_TYPES:
+            if needle in found_types:
+                return employment_type
         return None
 
-    def _extract_seniority_level(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_seniority_level(self, tree: LexborHTMLParser) -> Optional[str]:
         selectors = ['.job-details-jobs-unified-top-card__job-insight']
 
         for selector in selectors:
-            elements = soup.select(selector)
+            elements = tree.css(selector)
             for element in elements:
-                text = element.get_text().lower()
+                text = element.text().lower()
                 if 'seniority level' in text:
-                    return element.get_text(strip=True).split(':')[-1].strip()
+                    return element.text(strip=True).split(':')[-1].strip()
         return None
 
-    def _extract_company_size(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_company_size(self, tree: LexborHTMLParser) -> Optional[str]:
         # This might require additional API calls or be in company profile
         return None
 
-    def _extract_company_name(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_company_name(self, tree: LexborHTMLParser, json_ld: List[str], page_text: str) -> Optional[str]:
         """
         Extract company name using multiple fallback methods
         """
         # Method 1: JSON-LD structured data (most reliable)
-        company_name = self._extract_from_json_ld(soup)
+        company_name = self._extract_from_json_ld(json_ld)
         if company_name:
             return company_name
 
         # Method 2: Updated CSS selectors (2024/2025)
-        company_name = self._extract_from_css_selectors(soup)
+        company_name = self._extract_from_css_selectors(tree)
         if company_name:
             return company_name
 
         # Method 3: Meta tags and page title
-        company_name = self._extract_from_meta_tags(soup)
+        company_name = self._extract_from_meta_tags(tree)
         if company_name:
             return company_name
 
         # Method 4: Text pattern matching
-        company_name = self._extract_from_text_patterns(soup)
+        company_name = self._extract_from_text_patterns(page_text)
         if company_name:
             return company_name
 
         return None
 
-    def _extract_from_json_ld(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_from_json_ld(self, json_scripts: List[str]) -> Optional[str]:
         """
         Extract company name from JSON-LD structured data
         """
         try:
-            # Find all script tags with application/ld+json
-            json_scripts = soup.find_all('script', {'type': 'application/ld+json'})
-
+            # Bodies of the script tags with application/ld+json
             for script in json_scripts:
-                if script.string:
+                if script and any(key in script for key in _JSON_LD_KEYS):
                     try:
-                        data = json.loads(script.string)
+                        data = orjson.loads(script)
 
                         # Handle different JSON-LD structures
                         if isinstance(data, dict):
@@ -239,7 +285,7 @@ class LinkedInParser(JobSiteParser):
                                     if company_name:
                                         return company_name
 
-                    except json.JSONDecodeError:
+                    except orjson.JSONDecodeError:
                         continue
 
         except Exception as e:
@@ -251,19 +297,7 @@ class LinkedInParser(JobSiteParser):
         """
         Extract company name from a JSON-LD object
         """
-        # Common patterns in LinkedIn JSON-LD
-        company_paths = [
-            'hiringOrganization.name',
-            'hiringOrganization.legalName',
-            'employmentType.hiringOrganization.name',
-            'publisher.name',
-            'author.name',
-            'organization.name',
-            'company.name',
-            'employer.name'
-        ]
-
-        for path in company_paths:
+        for path in _COMPANY_PATHS:
             value = self._get_nested_value(data, path)
             if value and isinstance(value, str) and len(value.strip()) > 0:
                 return value.strip()
@@ -278,88 +312,54 @@ class LinkedInParser(JobSiteParser):
 
         return None
 
-    def _get_nested_value(self, data: dict, path: str):
+    def _get_nested_value(self, data: dict, keys: Tuple[str, ...]):
         """
-        Get nested value from dict using dot notation
+        Get nested value from dict following a pre-split dotted path
         """
-        keys = path.split('.')
         current = data
 
         for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+            if not isinstance(current, dict):
                 return None
+            current = current.get(key)
 
         return current
 
-    def _extract_from_css_selectors(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_from_css_selectors(self, tree: LexborHTMLParser) -> Optional[str]:
         """
         Extract using updated CSS selectors
         """
-        # Updated selectors for 2024/2025
-        selectors = [
-            # New LinkedIn job page selectors
-            '[data-test-id="job-details-header-company-name"]',
-            '[data-test-id="company-name"]',
-            '.job-details-jobs-unified-top-card__company-name a',
-            '.jobs-unified-top-card__company-name a',
-            '.jobs-unified-top-card__company-name',
-            '.job-details__company-link',
-            '.jobs-company-name',
-
-            # Alternative selectors
-            '[data-tracking-control-name="public_jobs_topcard-org-name"]',
-            '[data-tracking-control-name="public_jobs_topcard_org_name"]',
-            '.topcard__org-name-redirect',
-            '.job-details-jobs-unified-top-card__primary-description-container a',
-
-            # Generic fallbacks
-            '[class*="company-name"]',
-            '[class*="employer-name"]',
-            '[data-test*="company"]',
-            '[data-testid*="company"]'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
+        for selector in _COMPANY_SELECTORS:
+            element = tree.css_first(selector)
             if element:
-                text = element.get_text(strip=True)
+                text = element.text(strip=True)
                 if text and len(text) > 1 and len(text) < 100:
                     return text
 
         return None
 
-    def _extract_from_meta_tags(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_from_meta_tags(self, tree: LexborHTMLParser) -> Optional[str]:
         """
         Extract company name from meta tags and page title
         """
         # Check meta tags
-        meta_selectors = [
-            'meta[property="og:site_name"]',
-            'meta[name="author"]',
-            'meta[property="article:author"]',
-            'meta[name="company"]',
-            'meta[property="og:title"]'
-        ]
-
-        for selector in meta_selectors:
-            meta = soup.select_one(selector)
+        for selector in _META_SELECTORS:
+            meta = tree.css_first(selector)
             if meta:
-                content = meta.get('content', '')
+                # A bare attribute has the value None
+                content = meta.attributes.get('content') or ''
                 if content and len(content) > 1 and len(content) < 100:
                     # Clean up common suffixes
-                    content = re.sub(r'\s*\|\s*LinkedIn.*$', '', content)
-                    content = re.sub(r'\s*-\s*LinkedIn.*$', '', content)
+                    for suffix_pattern in _META_STRIP_RES:
+                        content = suffix_pattern.sub('', content)
                     if content.strip():
                         return content.strip()
 
         # Check page title
-        title = soup.find('title')
+        title = tree.css_first('title')
         if title:
-            title_text = title.get_text(strip=True)
-            # LinkedIn job titles often follow pattern: "Job Title - Company Name | LinkedIn"
-            match = re.search(r'-\s*([^|]+?)\s*\|\s*LinkedIn', title_text)
+            title_text = title.text(strip=True)
+            match = _TITLE_LINKEDIN_RE.search(title_text)
             if match:
                 company = match.group(1).strip()
                 if company and len(company) > 1:
@@ -367,22 +367,13 @@ class LinkedInParser(JobSiteParser):
 
         return None
 
-    def _extract_from_text_patterns(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_from_text_patterns(self, page_text: str) -> Optional[str]:
         """
         Extract company name using text pattern matching
         """
         # Look for common text patterns
-        patterns = [
-            r'(?i)company:\s*([^\n\r,]+)',
-            r'(?i)employer:\s*([^\n\r,]+)',
-            r'(?i)organization:\s*([^\n\r,]+)',
-            r'(?i)hiring\s+company:\s*([^\n\r,]+)'
-        ]
-
-        page_text = soup.get_text()
-
-        for pattern in patterns:
-            matches = re.findall(pattern, page_text)
+        for pattern in _TEXT_PATTERN_RES:
+            matches = pattern.findall(page_text)
             for match in matches:
                 match = match.strip()
                 if match and len(match) > 1 and len(match) < 100:
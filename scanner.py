@@ -1,12 +1,14 @@
-from typing import Optional, Dict, Any, List
-import spacy
+from typing import Optional, Dict, Any, List, Tuple
 import re
 from fastapi import HTTPException
-from keybert import KeyBERT
 from schema import JobAnalysisResponse, Skill
+from known_sites.keywords import KeywordMatcher
 import logging
+import os
 import sys
-from sentence_transformers import SentenceTransformer
+import threading
+import xxhash
+from cachetools import LRUCache
 
 # os.environ["HF_HUB_TOKEN"] = os.environ.get("HF_HUB_TOKEN")
 
@@ -18,15 +20,111 @@ logging.basicConfig(
     ]
 )
 
-# Load models (do this once at startup)
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Please install spacy English model: python -m spacy download en_core_web_sm")
-    raise
-
-local_model = SentenceTransformer("all-MiniLM-L6-v2")
-kw_model = KeyBERT(model=local_model)
+# Only the entity recognizer is used; in en_core_web_sm it has its own
+# embedding layer, so the shared tok2vec and everything else is skipped
+_NER_UNUSED_PIPES = ['tok2vec', 'tagger', 'parser', 'attribute_ruler', 'lemmatizer']
+
+# The embedding model runs on onnxruntime using the int8-quantized export
+# shipped with all-MiniLM-L6-v2. Set SENTENCE_MODEL_BACKEND=torch to go back
+# to FP32 PyTorch, or SENTENCE_MODEL_FILE to pick another export (e.g.
+# onnx/model_qint8_avx512_vnni.onnx on CPUs with VNNI)
+SENTENCE_MODEL_BACKEND = os.getenv("SENTENCE_MODEL_BACKEND", "onnx")
+SENTENCE_MODEL_FILE = os.getenv("SENTENCE_MODEL_FILE", "onnx/model_quint8_avx2.onnx")
+
+# Models (and their libraries) are loaded on first use, so workers that only
+# serve known-site parsers never pay for them. Loading happens once per
+# process, behind a lock since analyze() runs on worker threads
+nlp = None
+local_model = None
+kw_model = None
+_models_lock = threading.Lock()
+
+
+def _get_nlp():
+    global nlp
+    if nlp is None:
+        with _models_lock:
+            if nlp is None:
+                import spacy
+                try:
+                    nlp = spacy.load("en_core_web_sm", disable=_NER_UNUSED_PIPES)
+                except OSError:
+                    print("Please install spacy English model: python -m spacy download en_core_web_sm")
+                    raise
+    return nlp
+
+
+def _get_kw():
+    global local_model, kw_model
+    if kw_model is None:
+        with _models_lock:
+            if kw_model is None:
+                from keybert import KeyBERT
+                from sentence_transformers import SentenceTransformer
+
+                if SENTENCE_MODEL_BACKEND == "torch":
+                    local_model = SentenceTransformer("all-MiniLM-L6-v2")
+                else:
+                    local_model = SentenceTransformer("all-MiniLM-L6-v2", backend=SENTENCE_MODEL_BACKEND,
+                                                      model_kwargs={"file_name": SENTENCE_MODEL_FILE})
+                kw_model = KeyBERT(model=local_model)
+    return kw_model
+
+# Number of analyze() results kept in memory per analyzer
+ANALYSIS_CACHE_SIZE = 512
+
+# KeyBERT phrases fetched per document: the top 20 are matched against known
+# skills and the top 15 of up to 2 words become the keywords. KeyBERT scores
+# every candidate phrase either way, so all of them are returned: the top of
+# the (1, 3)-gram ranking is often mostly 3-grams, and a short cutoff would
+# leave fewer than 15 short phrases. Filtered to 2 words, the full ranking is
+# exactly the one a (1, 2)-gram run gives
+_KEYBERT_TOP_N = sys.maxsize
+_SKILL_CANDIDATES = 20
+_KEYWORD_COUNT = 15
+
+# Patterns are compiled once at import rather than looked up in re's cache per call
+# Matched against lowercased text, so no re.IGNORECASE
+_EXPERIENCE_RES = [re.compile(p) for p in [
+    r'(\d+)[\+\-\s]*(?:to|\-|–)?\s*(\d+)?\s*(?:years?|yrs?)\s+(?:of\s+)?experience',
+    r'(\d+)[\+\s]*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
+    r'minimum\s+(\d+)\s+(?:years?|yrs?)',
+    r'at\s+least\s+(\d+)\s+(?:years?|yrs?)',
+]]
+
+_COMPANY_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r'(?:at|@)\s+([A-Z][a-zA-Z\s&]+(?:Inc|LLC|Corp|Ltd|Company)?)',
+    r'([A-Z][a-zA-Z\s&]+(?:Inc|LLC|Corp|Ltd|Company))\s+is\s+(?:hiring|looking)',
+]]
+
+_TITLE_RES = [re.compile(p, re.MULTILINE | re.IGNORECASE) for p in [
+    r'(?:position|role|job)\s*:?\s*([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
+    r'(?:hiring|seeking)\s+(?:a|an)?\s*([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
+    r'^([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
+]]
+
+_SALARY_RE = re.compile(r'\$[\d,]+(?:\s*-\s*\$?[\d,]+)?(?:\s*(?:per\s+)?(?:year|annually|k|K))?')
+
+_SIZE_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r'(\d+[\+\-\s]*(?:to|\-)?\s*\d*)\s+employees',
+    r'(?:startup|small|medium|large|enterprise)\s+(?:company|organization)'
+]]
+
+# Required/preferred wording looked for around a skill mention
+_INDICATORS = KeywordMatcher({
+    'required': ['required', 'must have', 'essential', 'mandatory'],
+    'preferred': ['preferred', 'nice to have', 'bonus', 'plus'],
+})
+
+_DETAIL_KEYWORDS = KeywordMatcher({
+    'remote': ['remote', 'work from home', 'distributed', 'telecommute'],
+    'education': ['bachelor', 'master', 'phd', 'degree', 'university', 'college'],
+})
+
+_EXP_LEVEL_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r'(entry.level|junior|senior|lead|principal|staff)',
+    r'(\d+)[\+\s]*(?:years?|yrs?)\s+(?:of\s+)?(?:total\s+)?experience'
+]]
 
 
 class JobAnalyzer:
@@ -37,13 +135,6 @@ class JobAnalyzer:
             'designer', 'consultant', 'specialist', 'coordinator', 'director'
         }
 
-        self.experience_patterns = [
-            r'(\d+)[\+\-\s]*(?:to|\-|–)?\s*(\d+)?\s*(?:years?|yrs?)\s+(?:of\s+)?experience',
-            r'(\d+)[\+\s]*(?:years?|yrs?)\s+(?:of\s+)?(?:experience|exp)',
-            r'minimum\s+(\d+)\s+(?:years?|yrs?)',
-            r'at\s+least\s+(\d+)\s+(?:years?|yrs?)',
-        ]
-
         self.skill_keywords = {
             'programming': ['python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust'],
             'web': ['html', 'css', 'react', 'angular', 'vue', 'node.js', 'express'],
@@ -52,13 +143,21 @@ class JobAnalyzer:
             'tools': ['git', 'jenkins', 'jira', 'confluence']
         }
 
+        # Recent analyses keyed by content hash and the request fields;
+        # analyze() runs on worker threads, hence the lock
+        self._results = LRUCache(maxsize=ANALYSIS_CACHE_SIZE)
+        self._results_lock = threading.Lock()
+
+        # Flattened, lowercased skill vocabulary, built once rather than per call
+        self.all_skills = tuple(
+            skill.lower() for skill_list in self.skill_keywords.values() for skill in skill_list
+        )
+
     def extract_company_name(self, text: str) -> Optional[str]:
         """Extract company name using spaCy NER and patterns"""
-        doc = nlp(text)
-
         # Look for ORG entities in the first few sentences
         first_part = ' '.join(text.split()[:100])  # First 100 words
-        first_doc = nlp(first_part)
+        first_doc = _get_nlp()(first_part)
 
         companies = []
         for ent in first_doc.ents:
@@ -66,13 +165,8 @@ class JobAnalyzer:
                 companies.append(ent.text)
 
         # Additional patterns for company names
-        company_patterns = [
-            r'(?:at|@)\s+([A-Z][a-zA-Z\s&]+(?:Inc|LLC|Corp|Ltd|Company)?)',
-            r'([A-Z][a-zA-Z\s&]+(?:Inc|LLC|Corp|Ltd|Company))\s+is\s+(?:hiring|looking)',
-        ]
-
-        for pattern in company_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _COMPANY_RES:
+            matches = pattern.findall(text)
             companies.extend(matches)
 
         return companies[0].strip() if companies else None
@@ -80,14 +174,8 @@ class JobAnalyzer:
     def extract_job_title(self, text: str) -> Optional[str]:
         """Extract job title using patterns and NER"""
         # Common job title patterns
-        title_patterns = [
-            r'(?:position|role|job)\s*:?\s*([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
-            r'(?:hiring|seeking)\s+(?:a|an)?\s*([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
-            r'^([A-Z][a-zA-Z\s\-/]+(?:Engineer|Developer|Manager|Analyst|Designer|Lead|Director))',
-        ]
-
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.MULTILINE | re.IGNORECASE)
+        for pattern in _TITLE_RES:
+            match = pattern.search(text)
             if match:
                 title = match.group(1).strip()
                 if any(keyword in title.lower() for keyword in self.common_job_titles):
@@ -101,43 +189,50 @@ class JobAnalyzer:
 
         return None
 
-    def extract_skills_and_experience(self, text: str) -> List[Skill]:
+    def extract_keywords(self, text: str) -> List[Tuple[str, float]]:
+        """Run KeyBERT once per document; analyze() takes both the skills and
+        the keywords from its output"""
+        return _get_kw().extract_keywords(text, keyphrase_ngram_range=(1, 3), stop_words='english',
+                                          top_n=_KEYBERT_TOP_N)
+
+    def extract_skills_and_experience(self, text: str,
+                                      keywords: Optional[List[Tuple[str, float]]] = None,
+                                      text_lower: Optional[str] = None) -> List[Skill]:
         """Extract skills with associated experience requirements"""
-        skills = []
+        # Split into words once and share them across every skill lookup
+        tokens = self.tokenize(text, text_lower)
 
-        # Use KeyBERT to extract relevant keywords
-        keywords = kw_model.extract_keywords(text, keyphrase_ngram_range=(1, 3), stop_words='english', top_n=20)
+        # Use KeyBERT to extract relevant keywords (reusing analyze()'s run when given)
+        if keywords is None:
+            keywords = self.extract_keywords(text)
+        keywords = keywords[:_SKILL_CANDIDATES]
 
         # Filter keywords that match known skills
-        all_skills = []
-        for category, skill_list in self.skill_keywords.items():
-            all_skills.extend(skill_list)
-
         relevant_skills = []
         for keyword, score in keywords:
-            if any(skill.lower() in keyword.lower() for skill in all_skills):
+            keyword_lower = keyword.lower()
+            if any(skill in keyword_lower for skill in self.all_skills):
                 relevant_skills.append(keyword)
 
-        # Extract experience for each skill
-        for skill in relevant_skills:
-            experience = self.extract_experience_for_skill(text, skill)
-            is_required = self.is_skill_required(text, skill)
-
-            skills.append(Skill(
-                name=skill,
-                years_experience=experience,
-                is_required=is_required
-            ))
+        # Extract experience for each skill into plain parallel lists
+        years = [self.extract_experience_for_skill(text, skill, tokens) for skill in relevant_skills]
+        required = [self.is_skill_required(text, skill, tokens) for skill in relevant_skills]
 
-        return skills
+        # Models are only built at the end, and without validation since
+        # every value above already has the field's type
+        return [
+            Skill.model_construct(name=name, years_experience=years_exp, is_required=is_required)
+            for name, years_exp, is_required in zip(relevant_skills, years, required)
+        ]
 
-    def extract_experience_for_skill(self, text: str, skill: str) -> Optional[str]:
+    def extract_experience_for_skill(self, text: str, skill: str,
+                                     tokens: Optional[Tuple[List[str], str]] = None) -> Optional[str]:
         """Extract experience requirement for a specific skill"""
         # Look for experience mentions near the skill
-        skill_context = self.get_context_around_skill(text, skill)
+        skill_context = self.get_context_around_skill(text, skill, tokens=tokens).lower()
 
-        for pattern in self.experience_patterns:
-            match = re.search(pattern, skill_context, re.IGNORECASE)
+        for pattern in _EXPERIENCE_RES:
+            match = pattern.search(skill_context)
             if match:
                 if match.group(2):  # Range like "3-5 years"
                     return f"{match.group(1)}-{match.group(2)} years"
@@ -146,69 +241,66 @@ class JobAnalyzer:
 
         return None
 
-    def get_context_around_skill(self, text: str, skill: str, window: int = 50) -> str:
-        """Get text context around a skill mention"""
-        words = text.split()
-        skill_indices = []
+    def tokenize(self, text: str, text_lower: Optional[str] = None) -> Tuple[List[str], str]:
+        """Split text into words once for the per-skill context lookups.
+        The lowercased words are joined with newlines, which a skill never
+        contains, so a substring hit can't span two words"""
+        if text_lower is None:
+            text_lower = text.lower()
+        return text.split(), '\n'.join(text_lower.split())
 
-        for i, word in enumerate(words):
-            if skill.lower() in word.lower():
-                skill_indices.append(i)
+    def get_context_around_skill(self, text: str, skill: str, window: int = 50,
+                                 tokens: Optional[Tuple[List[str], str]] = None) -> str:
+        """Get text context around a skill mention"""
+        words, words_lower = tokens if tokens is not None else self.tokenize(text)
 
-        if not skill_indices:
+        # First word containing the skill: one C-level find, then the word
+        # index is the number of separators before the hit
+        hit = words_lower.find(skill.lower())
+        if hit < 0:
             return ""
 
         # Get context around first mention
-        idx = skill_indices[0]
+        idx = words_lower.count('\n', 0, hit)
         start = max(0, idx - window)
         end = min(len(words), idx + window)
 
         return ' '.join(words[start:end])
 
-    def is_skill_required(self, text: str, skill: str) -> bool:
+    def is_skill_required(self, text: str, skill: str, tokens: Optional[Tuple[List[str], str]] = None) -> bool:
         """Determine if a skill is required or preferred"""
-        skill_context = self.get_context_around_skill(text, skill)
-
-        required_indicators = ['required', 'must have', 'essential', 'mandatory']
-        preferred_indicators = ['preferred', 'nice to have', 'bonus', 'plus']
-
-        context_lower = skill_context.lower()
-
-        for indicator in required_indicators:
-            if indicator in context_lower:
-                return True
+        skill_context = self.get_context_around_skill(text, skill, tokens=tokens)
 
-        return False
+        # One automaton sweep over the context instead of a scan per indicator
+        return bool(_INDICATORS.scan(skill_context.lower())['required'])
 
-    def extract_additional_details(self, text: str, url: Optional[str] = None) -> Dict[str, Any]:
+    def extract_additional_details(self, text: str, url: Optional[str] = None,
+                                   text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Extract additional job posting details"""
         details = {}
+        if text_lower is None:
+            text_lower = text.lower()
 
-        # Salary extraction
-        salary_pattern = r'\$[\d,]+(?:\s*-\s*\$?[\d,]+)?(?:\s*(?:per\s+)?(?:year|annually|k|K))?'
-        salary_matches = re.findall(salary_pattern, text)
-        if salary_matches:
-            details['salary_range'] = salary_matches[0]
+        # Salary extraction; only the first match is used, so stop there
+        salary_match = _SALARY_RE.search(text)
+        if salary_match:
+            details['salary_range'] = salary_match.group(0)
+
+        # Remote work and education keywords come from one sweep of the text
+        keyword_hits = _DETAIL_KEYWORDS.scan(text_lower)
 
         # Remote work detection
-        remote_keywords = ['remote', 'work from home', 'distributed', 'telecommute']
-        details['remote_work'] = any(keyword in text.lower() for keyword in remote_keywords)
+        details['remote_work'] = bool(keyword_hits['remote'])
 
         # Company size indicators
-        size_patterns = [
-            r'(\d+[\+\-\s]*(?:to|\-)?\s*\d*)\s+employees',
-            r'(?:startup|small|medium|large|enterprise)\s+(?:company|organization)'
-        ]
-
-        for pattern in size_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SIZE_RES:
+            match = pattern.search(text)
             if match:
                 details['company_size'] = match.group(0)
                 break
 
         # Education requirements
-        education_keywords = ['bachelor', 'master', 'phd', 'degree', 'university', 'college']
-        details['education_required'] = any(keyword in text.lower() for keyword in education_keywords)
+        details['education_required'] = bool(keyword_hits['education'])
 
         if url:
             details['source_url'] = url
@@ -232,7 +324,24 @@ class JobAnalyzer:
 
     def analyze(self, content: str, url: Optional[str] = None, title: Optional[str] = None,
                 company_guess: Optional[str] = None) -> JobAnalysisResponse:
-        """Main analysis method"""
+        """Main analysis method, memoized on the posting so re-scraped or
+        retried postings skip the models"""
+        key = (xxhash.xxh3_128_digest(content.encode()), url, title, company_guess)
+        with self._results_lock:
+            cached = self._results.get(key)
+        if cached is not None:
+            return JobAnalysisResponse.model_validate(cached)
+
+        result = self._analyze(content, url, title, company_guess)
+
+        # Stored as a plain dict and rebuilt per hit, since callers fill in
+        # fields on the model they get back
+        with self._results_lock:
+            self._results[key] = result.model_dump()
+        return result
+
+    def _analyze(self, content: str, url: Optional[str], title: Optional[str],
+                 company_guess: Optional[str]) -> JobAnalysisResponse:
         try:
             # Use provided title as fallback if extraction fails
             job_title = self.extract_job_title(content)
@@ -244,26 +353,29 @@ class JobAnalyzer:
             if not company_name and company_guess:
                 company_name = company_guess
 
-            skills = self.extract_skills_and_experience(content)
+            # Lowercased once and shared by the text scans below; the salary,
+            # company size and level patterns return matched text, so they
+            # keep running on the original
+            content_lower = content.lower()
 
-            # Extract keywords using KeyBERT
-            keywords_raw = kw_model.extract_keywords(content, keyphrase_ngram_range=(1, 2), stop_words='english', top_n=15)
-            keywords = [kw[0] for kw in keywords_raw]
+            # Embedding the document is the heaviest step, so KeyBERT runs once
+            # and both the skills and the keywords are taken from its output
+            keywords_raw = self.extract_keywords(content)
+
+            skills = self.extract_skills_and_experience(content, keywords_raw, content_lower)
+
+            # Keywords are the top phrases of up to 2 words
+            keywords = [kw for kw, _ in keywords_raw if len(kw.split()) <= 2][:_KEYWORD_COUNT]
 
             # Extract experience level
             experience_level = None
-            exp_patterns = [
-                r'(entry.level|junior|senior|lead|principal|staff)',
-                r'(\d+)[\+\s]*(?:years?|yrs?)\s+(?:of\s+)?(?:total\s+)?experience'
-            ]
-
-            for pattern in exp_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in _EXP_LEVEL_RES:
+                match = pattern.search(content)
                 if match:
                     experience_level = match.group(1)
                     break
 
-            additional_details = self.extract_additional_details(content, url)
+            additional_details = self.extract_additional_details(content, url, content_lower)
 
             # Add browser extension provided data to additional details
             if title:
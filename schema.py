@@ -1,15 +1,21 @@
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 
 # Request/Response models
 class JobPostingRequest(BaseModel):
     content: str
     url: Optional[str] = None
+    # A str: the JSON body is decoded to str before validation, so a bytes
+    # field would only add an encoded copy of the page
     rawHTML : Optional[str] = None
     title: Optional[str] = None
     companyGuess: Optional[str] = None
 
 
+class JobPostingBatchRequest(BaseModel):
+    postings: List[JobPostingRequest]
+
+
 class Skill(BaseModel):
     name: str
     years_experience: Optional[str] = None
@@ -24,4 +30,15 @@ class JobAnalysisResponse(BaseModel):
     skills: List[Skill]
     experience_level: Optional[str]
     additional_details: Dict[str, Any]
-    confidence_scores: Dict[str, float]
\ No newline at end of file
+    confidence_scores: Dict[str, float]
+
+
+class JobAnalysisError(BaseModel):
+    """A batch entry for a posting that was rejected or failed to analyze"""
+    success: bool = False
+    status_code: int
+    error: str
+
+
+class JobAnalysisBatchResponse(BaseModel):
+    results: List[Union[JobAnalysisResponse, JobAnalysisError]]
\ No newline at end of file
@@ -1,28 +1,96 @@
 from dotenv import load_dotenv
+import asyncio
+import hashlib
 import logging
-import sys
-import requests
+import httpx
+import orjson
 import re
-from urllib.parse import urlparse
-from typing import Optional, Dict
+import threading
+from cachetools import TTLCache
+from urllib.parse import urlsplit
+from typing import List, Optional, Dict, Tuple
+from weakref import WeakKeyDictionary
 from supabase import create_client, Client
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 
 load_dotenv()
 
-logging.basicConfig(
-    level=logging.DEBUG,  # or INFO if you want less noise
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout)  # ensures logs show up in console
-    ]
-)
+# Progress is logged at DEBUG; the application configures the handlers and level
+logger = logging.getLogger(__name__)
 
 supabase_url = os.getenv("SUPABASE_URL")
 supabase_key = os.getenv("SUPABASE_KEY")
 clearbit_api_key = os.getenv("CLEARBIT_API_KEY")
 
+# Transient errors and rate limits from Google CSE / Clearbit are retried with backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.3
+
+# Career pages found or read from Supabase are also kept in-process, so
+# repeat lookups for a company skip the database round trip
+MEMORY_CACHE_SIZE = 4096
+MEMORY_CACHE_TTL = 24 * 3600
+
+# Career pages older than this are looked up again
+CACHE_MAX_AGE = timedelta(days=30)
+
+# Company domains change far less often than career page URLs, so Clearbit
+# answers are kept separately and for longer
+DOMAIN_CACHE_MAX_AGE = timedelta(days=180)
+
+# Google CSE responses are reused for this long; after that a stored ETag is
+# sent so an unchanged response can come back as a bodiless 304
+SEARCH_CACHE_MAX_AGE = timedelta(hours=24)
+
+# How many uncached companies find_career_pages searches for at once
+BULK_CONCURRENCY = 8
+
+# Each Google search asks for pages containing any of these, through CSE's
+# orTerms, instead of sending one query per term
+CAREER_OR_TERMS = 'careers jobs hiring employment'
+
+# A search result scoring this high is taken without scoring the rest
+EARLY_EXIT_SCORE = 200
+
+# Legal suffixes dropped from the end of a company name. The group repeats,
+# so every trailing suffix comes off whatever its order: "Foo Inc Co" becomes
+# "Foo" (the old one-pass-per-suffix loop left "Foo Inc")
+_COMPANY_SUFFIX_RE = re.compile(
+    r'(?:\b(?:Inc\.?|LLC|Corp\.?|Corporation|Ltd|Limited|Co)\b\s*)+$', re.IGNORECASE
+)
+
+
+def _any_of(*needles: str) -> re.Pattern:
+    """One pattern matching any of the literal needles, so a string is
+    scanned once rather than once per needle"""
+    return re.compile('|'.join(map(re.escape, needles)))
+
+
+# Job board hosts, never taken as a company's own career page. Subdomains
+# (www., uk., ...) are matched by walking up to the parent domain
+_JOB_BOARD_HOSTS = frozenset({
+    'indeed.com', 'linkedin.com', 'glassdoor.com', 'ziprecruiter.com',
+    'monster.com', 'careerbuilder.com', 'simplyhired.com'
+})
+
+
+def _is_job_board(host: str) -> bool:
+    while host:
+        if host in _JOB_BOARD_HOSTS:
+            return True
+        host = host.partition('.')[2]
+    return False
+
+
+# Needles for _score_career_url; the text they are searched in is lowercased
+_CAREER_KEYWORD_RE = _any_of('career', 'jobs', 'hiring', 'employment', 'work', 'join')
+_CAREER_TERM_RE = _any_of('career', 'jobs', 'hiring')
+_CAREER_PATTERN_RE = _any_of('/careers', '/jobs', '/hiring', 'careers.', 'jobs.')
+_OFFICIAL_INDICATOR_RE = _any_of('careers at', 'jobs at', 'work at', 'join our team')
+
+
 class EnhancedCareerPageFinder:
     def __init__(self, local_google_api_key: str, google_cse_id: str):
         self.google_api_key = local_google_api_key
@@ -34,6 +102,17 @@ class EnhancedCareerPageFinder:
         # Initialize client
         self.supabase: Client = create_client(supabase_url, supabase_key)
 
+        # Keyed by the normalized company name; read and written from worker threads
+        self._mem_cache: TTLCache = TTLCache(maxsize=MEMORY_CACHE_SIZE, ttl=MEMORY_CACHE_TTL)
+        self._mem_cache_lock = threading.Lock()
+
+        # HTTP/2 clients for Google CSE and Clearbit, so concurrent queries to
+        # the same host are multiplexed over one TLS connection. An async
+        # client's connections belong to the event loop that opened them, so
+        # there is one client per loop, created on first use
+        self._aclients: WeakKeyDictionary = WeakKeyDictionary()
+
+    # Superseded by the Supabase schema in supabase.sql
     # def _setup_database(self):
     #     """Initialize the SQLite database for caching career pages"""
     #     conn = sqlite3.connect(self.db_path)
@@ -43,13 +122,14 @@ class EnhancedCareerPageFinder:
     #         CREATE TABLE IF NOT EXISTS career_pages (
     #             id BIGSERIAL PRIMARY KEY,
     #             company_name TEXT NOT NULL,
+    #             company_name_norm TEXT NOT NULL,
     #             company_domain TEXT,
     #             career_url TEXT,
     #             source TEXT,
     #             confidence_score INTEGER,
     #             created_at TIMESTAMPTZ DEFAULT NOW(),
     #             last_verified TIMESTAMPTZ DEFAULT NOW(),
-    #             UNIQUE(company_name)
+    #             UNIQUE(company_name_norm)
     #         );
     #     ''')
     #
@@ -57,6 +137,16 @@ class EnhancedCareerPageFinder:
     #     conn.close()
 
     def find_career_page(self, company_name: str, force_refresh: bool = False) -> Optional[Dict]:
+        """Blocking wrapper around afind_career_page for callers without an event loop"""
+        async def run() -> Optional[Dict]:
+            try:
+                return await self.afind_career_page(company_name, force_refresh)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def afind_career_page(self, company_name: str, force_refresh: bool = False) -> Optional[Dict]:
         """
         Main function to find career page using layered approach
 
@@ -67,66 +157,262 @@ class EnhancedCareerPageFinder:
         Returns:
             Dict with career_url, domain, source, confidence_score or None
         """
-        print(f"🔍 Finding career page for: {company_name}")
+        logger.debug("Finding career page for: %s", company_name)
 
-        # Step 1: Check database cache first (unless force refresh)
+        # Step 1: Check database cache first (unless force refresh).
+        # The Supabase client is blocking, so it runs on a worker thread
         if not force_refresh:
-            cached_result = self._get_from_cache(company_name)
+            cached_result = await asyncio.to_thread(self._get_from_cache, company_name)
             if cached_result:
-                print(f"📋 Found in cache: {cached_result['career_url']}")
+                logger.debug("Found in cache: %s", cached_result['career_url'])
                 return cached_result
 
-        # Step 2: Try Clearbit domain lookup
-        print("🌐 Trying Clearbit domain lookup...")
-        company_domain = self._clearbit_domain_lookup(company_name)
-
-        career_result = None
-
-        if company_domain:
-            print(f"✅ Clearbit found domain: {company_domain}")
-            # Step 3a: Targeted Google search within the domain
-            career_result = self._targeted_google_search(company_name, company_domain)
-
-        else:
-            print("❌ No domain from Clearbit")
-
-        # Step 3b: Fallback to broad Google search if targeted search failed
-        if not career_result:
-            print("🔍 Trying broad Google search...")
-            career_result = self._broad_google_search(company_name)
+        # Steps 2-3: Clearbit domain, then Google
+        career_result, company_domain = await self._search_career_page(company_name)
 
         # Step 4: Cache the result
         if career_result:
-            self._cache_result(company_name, career_result, company_domain)
-            print(f"💾 Cached result for future use")
+            await asyncio.to_thread(self._cache_result, company_name, career_result, company_domain)
+            logger.debug("Cached result for %s", company_name)
             return career_result
 
-        print(f"❌ No career page found for {company_name}")
+        logger.debug("No career page found for %s", company_name)
         return None
 
+    def find_career_pages(self, company_names: List[str], force_refresh: bool = False) -> Dict[str, Optional[Dict]]:
+        """Blocking wrapper around afind_career_pages for callers without an event loop"""
+        async def run() -> Dict[str, Optional[Dict]]:
+            try:
+                return await self.afind_career_pages(company_names, force_refresh)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
+
+    async def afind_career_pages(self, company_names: List[str],
+                                 force_refresh: bool = False) -> Dict[str, Optional[Dict]]:
+        """
+        Find career pages for several companies, reading the cache for all of
+        them in one query and writing the new results back in one upsert
+
+        Args:
+            company_names: Names of the companies
+            force_refresh: Skip cache and do fresh lookups
+
+        Returns:
+            Dict of each company name to its find_career_page result
+        """
+        # Names with the same normalized form are looked up once
+        names: Dict[str, str] = {}
+        for company_name in company_names:
+            names.setdefault(self._normalize_company_name(company_name), company_name)
+
+        found: Dict[str, Optional[Dict]] = {}
+        if not force_refresh:
+            found = await asyncio.to_thread(self._bulk_get_from_cache, list(names.values()))
+        misses = [(key, company_name) for key, company_name in names.items() if key not in found]
+        logger.debug("%d of %d companies found in cache", len(names) - len(misses), len(names))
+
+        semaphore = asyncio.Semaphore(BULK_CONCURRENCY)
+
+        async def search(company_name: str):
+            async with semaphore:
+                return await self._search_career_page(company_name)
+
+        searched = await asyncio.gather(*(search(company_name) for _, company_name in misses))
+
+        new_entries = []
+        for (key, company_name), (career_result, company_domain) in zip(misses, searched):
+            found[key] = career_result
+            if career_result:
+                new_entries.append((company_name, career_result, company_domain))
+
+        if new_entries:
+            await asyncio.to_thread(self._cache_results, new_entries)
+            logger.debug("Cached %d results", len(new_entries))
+
+        return {company_name: found[self._normalize_company_name(company_name)] for company_name in company_names}
+
+    async def _search_career_page(self, company_name: str) -> Tuple[Optional[Dict], Optional[str]]:
+        """Look up a career page with Clearbit and Google, returning it with
+        the Clearbit domain (if any)"""
+        # The broad search is the fallback, but it doesn't depend on the domain,
+        # so it starts now and runs while the domain lookup is in flight
+        broad_search = asyncio.create_task(self._broad_google_search(company_name))
+
+        try:
+            # Step 2: Try Clearbit domain lookup
+            company_domain = await self._lookup_domain(company_name)
+
+            career_result = None
+
+            if company_domain:
+                # Step 3a: Targeted Google search within the domain
+                career_result = await self._targeted_google_search(company_name, company_domain)
+
+            else:
+                logger.debug("No domain from Clearbit for %s", company_name)
+
+            # Step 3b: Fallback to broad Google search if targeted search failed
+            if not career_result:
+                logger.debug("Using broad Google search for %s", company_name)
+                career_result = await broad_search
+
+            return career_result, company_domain
+        finally:
+            # Not needed once the targeted search has answered
+            broad_search.cancel()
+
+    async def _lookup_domain(self, company_name: str) -> Optional[str]:
+        """Company domain from the domain cache, else from Clearbit"""
+        company_domain = await asyncio.to_thread(self._get_domain_from_cache, company_name)
+        if company_domain:
+            logger.debug("Found domain in cache: %s", company_domain)
+            return company_domain
+
+        logger.debug("Trying Clearbit domain lookup for %s", company_name)
+        company_domain = await self._clearbit_domain_lookup(company_name)
+        if company_domain:
+            logger.debug("Clearbit found domain: %s", company_domain)
+            await asyncio.to_thread(self._cache_domain, company_name, company_domain)
+
+        return company_domain
+
+    async def aclose(self):
+        """Close the HTTP client belonging to the running event loop"""
+        client = self._aclients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _client(self) -> httpx.AsyncClient:
+        """HTTP client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        client = self._aclients.get(loop)
+        if client is None:
+            client = self._aclients[loop] = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=10.0
+            )
+        return client
+
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET with retries on transient errors and rate limits"""
+        client = self._client()
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await client.get(url, **kwargs)
+            except httpx.TransportError:
+                if attempt == MAX_RETRIES:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    return response
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
     def _get_from_cache(self, company_name: str) -> Optional[Dict]:
-        """Get cached career page from database"""
-        thirty_days_ago = datetime.now() - timedelta(days=30)
+        """Get cached career page from memory, then the database"""
+        key = self._normalize_company_name(company_name)
+        with self._mem_cache_lock:
+            cached = self._mem_cache.get(key)
+        if cached:
+            return dict(cached)
+
+        thirty_days_ago = datetime.now() - CACHE_MAX_AGE
 
         local_result = self.supabase.table('career_pages') \
             .select('company_domain, career_url, source, confidence_score, last_verified') \
-            .ilike('company_name', company_name) \
+            .eq('company_name_norm', key) \
             .gt('last_verified', thirty_days_ago.isoformat()) \
             .execute()
 
         if local_result.data:
-            row = local_result.data[0]
-            return {
-                'domain': row['company_domain'],
-                'career_url': row['career_url'],
-                'source': row['source'],
-                'confidence_score': row['confidence_score'],
-                'last_verified': row['last_verified']
-            }
+            cached = self._row_to_result(local_result.data[0])
+            with self._mem_cache_lock:
+                self._mem_cache[key] = cached
+            return dict(cached)
 
         return None
 
-    def _clearbit_domain_lookup(self, company_name: str) -> Optional[str]:
+    def _get_domain_from_cache(self, company_name: str) -> Optional[str]:
+        """Get a cached Clearbit domain from database. Failures are logged
+        and treated as a miss"""
+        oldest = datetime.now() - DOMAIN_CACHE_MAX_AGE
+
+        try:
+            local_result = self.supabase.table('company_domains') \
+                .select('company_domain') \
+                .eq('company_name_norm', self._normalize_company_name(company_name)) \
+                .gt('last_verified', oldest.isoformat()) \
+                .execute()
+        except Exception as e:
+            logger.warning("Domain cache read error: %s", e)
+            return None
+
+        if local_result.data:
+            return local_result.data[0]['company_domain']
+
+        return None
+
+    def _cache_domain(self, company_name: str, domain: str):
+        """Cache a Clearbit domain in database. Failures are logged, the
+        domain is still used"""
+        data = {
+            'company_name_norm': self._normalize_company_name(company_name),
+            'company_domain': domain,
+            'last_verified': datetime.now().isoformat()
+        }
+
+        try:
+            self.supabase.table('company_domains') \
+                .upsert(data, on_conflict='company_name_norm') \
+                .execute()
+        except Exception as e:
+            logger.warning("Domain cache write error: %s", e)
+
+    def _bulk_get_from_cache(self, company_names: List[str]) -> Dict[str, Dict]:
+        """Get cached career pages for several companies, keyed by normalized
+        name, with one database query for those not in memory"""
+        found: Dict[str, Dict] = {}
+        remaining = []
+        with self._mem_cache_lock:
+            for company_name in company_names:
+                key = self._normalize_company_name(company_name)
+                cached = self._mem_cache.get(key)
+                if cached:
+                    found[key] = dict(cached)
+                else:
+                    remaining.append(key)
+
+        if not remaining:
+            return found
+
+        thirty_days_ago = datetime.now() - CACHE_MAX_AGE
+
+        local_result = self.supabase.table('career_pages') \
+            .select('company_name_norm, company_domain, career_url, source, confidence_score, last_verified') \
+            .in_('company_name_norm', remaining) \
+            .gt('last_verified', thirty_days_ago.isoformat()) \
+            .execute()
+
+        with self._mem_cache_lock:
+            for row in local_result.data:
+                key = row['company_name_norm']
+                found[key] = self._mem_cache[key] = self._row_to_result(row)
+        return {key: dict(cached) for key, cached in found.items()}
+
+    @staticmethod
+    def _row_to_result(row: Dict) -> Dict:
+        """Shape a career_pages row like a find_career_page result"""
+        return {
+            'domain': row['company_domain'],
+            'career_url': row['career_url'],
+            'source': row['source'],
+            'confidence_score': row['confidence_score'],
+            'last_verified': row['last_verified']
+        }
+
+    async def _clearbit_domain_lookup(self, company_name: str) -> Optional[str]:
         """Use Clearbit to find company's official domain"""
         try:
             headers = {
@@ -136,119 +422,181 @@ class EnhancedCareerPageFinder:
 
             params = {'name': company_name}
 
-            response = requests.get(
+            response = await self._get(
                 self.clearbit_base_url,
                 headers=headers,
-                params=params,
-                timeout=10
+                params=params
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return data.get('domain')
 
         except Exception as e:
-            print(f"Clearbit error: {e}")
+            logger.warning("Clearbit error: %s", e)
 
         return None
 
-    def _targeted_google_search(self, company_name: str, domain: str) -> Optional[Dict]:
+    async def _targeted_google_search(self, company_name: str, domain: str) -> Optional[Dict]:
         """Search for career page within a specific domain"""
-        search_queries = [
-            f'site:{domain} careers',
-            f'site:{domain} jobs',
-            f'site:{domain} hiring',
-            f'site:{domain} "careers" OR "jobs" OR "hiring"'
-        ]
+        query = f'site:{domain}'
+        logger.debug("Trying: %s", query)
+        results = await self._google_search(query, or_terms=CAREER_OR_TERMS)
 
-        for query in search_queries:
-            print(f"  Trying: {query}")
-            results = self._google_search(query)
-
-            if results:
-                best_result = self._find_best_career_url(results, company_name, is_targeted=True)
-                if best_result:
-                    return {
-                        'domain': domain,
-                        'career_url': best_result['url'],
-                        'source': 'targeted_google_clearbit',
-                        'confidence_score': best_result['score']
-                    }
+        best_result = self._find_best_career_url(results, company_name, is_targeted=True) if results else None
+        if best_result:
+            return {
+                'domain': domain,
+                'career_url': best_result['url'],
+                'source': 'targeted_google_clearbit',
+                'confidence_score': best_result['score']
+            }
 
         return None
 
-    def _broad_google_search(self, company_name: str) -> Optional[Dict]:
+    async def _broad_google_search(self, company_name: str) -> Optional[Dict]:
         """Broad Google search across the entire web"""
-        search_queries = [
-            f'"{company_name}" careers',
-            f'"{company_name}" jobs',
-            f'"{company_name}" careers OR jobs OR hiring'
-        ]
+        query = f'"{company_name}"'
+        logger.debug("Trying: %s", query)
+        results = await self._google_search(query, or_terms=CAREER_OR_TERMS)
 
-        for query in search_queries:
-            print(f"  Trying: {query}")
-            results = self._google_search(query)
-
-            if results:
-                best_result = self._find_best_career_url(results, company_name, is_targeted=False)
-                if best_result:
-                    domain = urlparse(best_result['url']).netloc
-                    return {
-                        'domain': domain,
-                        'career_url': best_result['url'],
-                        'source': 'broad_google',
-                        'confidence_score': best_result['score']
-                    }
+        best_result = self._find_best_career_url(results, company_name, is_targeted=False) if results else None
+        if best_result:
+            return {
+                'domain': best_result['domain'],
+                'career_url': best_result['url'],
+                'source': 'broad_google',
+                'confidence_score': best_result['score']
+            }
 
         return None
 
-    def _google_search(self, query: str, num_results: int = 10) -> list:
-        """Perform Google Custom Search"""
+    async def _google_search(self, query: str, num_results: int = 10, or_terms: Optional[str] = None) -> list:
+        """Perform Google Custom Search. Results must also contain at least
+        one of the space-separated or_terms, if given"""
         params = {
             'key': self.google_api_key,
             'cx': self.google_cse_id,
             'q': query,
             'num': min(num_results, 10)
         }
+        if or_terms:
+            params['orTerms'] = or_terms
+
+        query_hash = hashlib.blake2b(
+            '\n'.join((self.google_cse_id or '', query, or_terms or '', str(params['num']))).encode(),
+            digest_size=16
+        ).hexdigest()
+
+        cached = await asyncio.to_thread(self._get_search_from_cache, query_hash)
+        if cached and datetime.now(timezone.utc) - cached['fetched_at'] < SEARCH_CACHE_MAX_AGE:
+            return cached['items']
+
+        headers = {'If-None-Match': cached['etag']} if cached and cached['etag'] else None
+
+        try:
+            response = await self._get(self.google_base_url, params=params, headers=headers)
+            if response.status_code == 304:
+                items = cached['items']
+            else:
+                response.raise_for_status()
+
+                data = orjson.loads(response.content)
+                items = data.get('items', [])
 
+        except Exception as e:
+            logger.warning("Google search error: %s", e)
+            # A stale response is better than none
+            return cached['items'] if cached else []
+
+        etag = cached['etag'] if response.status_code == 304 else response.headers.get('etag')
+        await asyncio.to_thread(self._cache_search, query_hash, etag, items)
+        return items
+
+    def _get_search_from_cache(self, query_hash: str) -> Optional[Dict]:
+        """Get a stored Google CSE response from database, fresh or not.
+        Failures are logged and treated as a miss"""
         try:
-            response = requests.get(self.google_base_url, params=params, timeout=10)
-            response.raise_for_status()
+            local_result = self.supabase.table('google_cse_cache') \
+                .select('etag, items, fetched_at') \
+                .eq('query_hash', query_hash) \
+                .execute()
+        except Exception as e:
+            logger.warning("Search cache read error: %s", e)
+            return None
 
-            data = response.json()
-            return data.get('items', [])
+        if local_result.data:
+            row = local_result.data[0]
+            fetched_at = datetime.fromisoformat(row['fetched_at'])
+            if fetched_at.tzinfo is None:
+                fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+            return {'etag': row['etag'], 'items': row['items'] or [], 'fetched_at': fetched_at}
+
+        return None
 
+    def _cache_search(self, query_hash: str, etag: Optional[str], items: list):
+        """Store a Google CSE response in database. Failures are logged, the
+        search result is still used"""
+        data = {
+            'query_hash': query_hash,
+            'etag': etag,
+            'items': items,
+            'fetched_at': datetime.now(timezone.utc).isoformat()
+        }
+
+        try:
+            self.supabase.table('google_cse_cache') \
+                .upsert(data, on_conflict='query_hash') \
+                .execute()
         except Exception as e:
-            print(f"Google search error: {e}")
-            return []
+            logger.warning("Search cache write error: %s", e)
 
     def _find_best_career_url(self, search_results: list, company_name: str, is_targeted: bool) -> Optional[Dict]:
         """Find the best career URL from search results"""
-        scored_results = []
+        best = None
+        best_rank = 0
+        company_lower = self._clean_company_name(company_name).lower()
 
-        for result in search_results:
+        # Likely career pages first (a /careers path, then the shortest URLs),
+        # so the early exit below usually triggers within the first results.
+        # Each result keeps its Google rank, which decides between equal scores;
+        # a result past the early exit score is taken as soon as it is reached
+        ordered_results = sorted(
+            enumerate(search_results),
+            key=lambda ranked: ('/careers' not in ranked[1].get('link', '').lower(), len(ranked[1].get('link', '')))
+        )
+
+        for rank, result in ordered_results:
             url = result.get('link', '')
             title = result.get('title', '')
             snippet = result.get('snippet', '')
 
-            score = self._score_career_url(url, title, snippet, company_name, is_targeted)
+            # Parsed once here; the host is scored and the netloc kept as the domain
+            parts = urlsplit(url)
+            score = self._score_career_url(url, parts.hostname or '', title, snippet, company_lower, is_targeted)
 
-            if score > 0:
-                scored_results.append({
+            if score > 0 and (best is None or score > best['score']
+                              or (score == best['score'] and rank < best_rank)):
+                best_rank = rank
+                best = {
                     'score': score,
                     'url': url,
-                    'title': title
-                })
+                    'title': title,
+                    'domain': parts.netloc
+                }
+                if score >= EARLY_EXIT_SCORE:
+                    break
 
-        if scored_results:
-            best = max(scored_results, key=lambda x: x['score'])
-            if best['score'] >= (30 if is_targeted else 50):  # Lower threshold for targeted
-                return best
+        if best and best['score'] >= (30 if is_targeted else 50):  # Lower threshold for targeted
+            return best
 
         return None
 
-    def _score_career_url(self, url: str, title: str, snippet: str, company_name: str, is_targeted: bool) -> int:
-        """Score a career URL (enhanced for targeted vs broad search)"""
+    def _score_career_url(self, url: str, host: str, title: str, snippet: str, company_lower: str,
+                          is_targeted: bool) -> int:
+        """Score a career URL (enhanced for targeted vs broad search).
+        host is the URL's lowercased hostname and company_lower the cleaned,
+        lowercased company name"""
         if not url:
             return 0
 
@@ -256,30 +604,20 @@ class EnhancedCareerPageFinder:
         url_lower = url.lower()
         title_lower = title.lower()
         snippet_lower = snippet.lower()
-        company_lower = self._clean_company_name(company_name).lower()
 
         # Exclude job boards
-        job_boards = [
-            'indeed.com', 'linkedin.com', 'glassdoor.com', 'ziprecruiter.com',
-            'monster.com', 'careerbuilder.com', 'simplyhired.com'
-        ]
-
-        if any(board in url_lower for board in job_boards):
+        if _is_job_board(host):
             return 0
 
         # Must have career-related keywords
-        career_keywords = ['career', 'jobs', 'hiring', 'employment', 'work', 'join']
-        has_career_keyword = any(keyword in url_lower or keyword in title_lower
-                                 for keyword in career_keywords)
-
-        if not has_career_keyword:
+        if not (_CAREER_KEYWORD_RE.search(url_lower) or _CAREER_KEYWORD_RE.search(title_lower)):
             return 0
 
         # Scoring (higher for targeted searches since we trust the domain)
         base_multiplier = 1.2 if is_targeted else 1.0
 
         # URL contains career terms
-        if any(term in url_lower for term in ['career', 'jobs', 'hiring']):
+        if _CAREER_TERM_RE.search(url_lower):
             score += int(50 * base_multiplier)
 
         # Company name in title
@@ -287,13 +625,11 @@ class EnhancedCareerPageFinder:
             score += int(75 * base_multiplier)
 
         # Career URL patterns
-        career_patterns = ['/careers', '/jobs', '/hiring', 'careers.', 'jobs.']
-        if any(pattern in url_lower for pattern in career_patterns):
+        if _CAREER_PATTERN_RE.search(url_lower):
             score += int(40 * base_multiplier)
 
         # Official indicators in title
-        official_indicators = ['careers at', 'jobs at', 'work at', 'join our team']
-        if any(indicator in title_lower for indicator in official_indicators):
+        if _OFFICIAL_INDICATOR_RE.search(title_lower):
             score += int(60 * base_multiplier)
 
         # For targeted searches, give bonus for being on the expected domain
@@ -304,53 +640,58 @@ class EnhancedCareerPageFinder:
 
     def _clean_company_name(self, company_name: str) -> str:
         """Clean company name by removing suffixes"""
-        suffixes = ['Inc', 'Inc.', 'LLC', 'Corp', 'Corp.', 'Corporation', 'Ltd', 'Limited', 'Co']
-
-        cleaned = company_name
-        for suffix in suffixes:
-            pattern = r'\b' + re.escape(suffix) + r'\b\s*$'
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+        return _COMPANY_SUFFIX_RE.sub('', company_name).strip()
 
-        return cleaned.strip()
+    def _normalize_company_name(self, company_name: str) -> str:
+        """Cache key for a company: suffixes such as Inc removed, lowercased.
+        Stored as career_pages.company_name_norm, which has a unique index"""
+        return self._clean_company_name(company_name).strip().lower()
 
     def _cache_result(self, company_name: str, parameter_result: Dict, domain: Optional[str]):
         """Cache the result in database"""
-        data = {
-            'company_name': company_name,
-            'company_domain': domain,
-            'career_url': parameter_result['career_url'],
-            'source': parameter_result['source'],
-            'confidence_score': parameter_result['confidence_score'],
-            'last_verified': datetime.now().isoformat()
-        }
+        self._cache_results([(company_name, parameter_result, domain)])
+
+    def _cache_results(self, entries: List[Tuple[str, Dict, Optional[str]]]):
+        """Cache several (company_name, result, domain) entries in one upsert"""
+        last_verified = datetime.now().isoformat()
+        rows = [
+            {
+                'company_name': company_name,
+                'company_name_norm': self._normalize_company_name(company_name),
+                'company_domain': domain,
+                'career_url': parameter_result['career_url'],
+                'source': parameter_result['source'],
+                'confidence_score': parameter_result['confidence_score'],
+                'last_verified': last_verified
+            }
+            for company_name, parameter_result, domain in entries
+        ]
 
-        # Supabase upsert (INSERT OR REPLACE equivalent)
-        self.supabase.table('career_pages') \
-            .upsert(data, on_conflict='company_name') \
-            .execute()
+        # Supabase upsert (INSERT OR REPLACE equivalent). A failed write only
+        # costs a later lookup, so it is logged rather than losing the result
+        # that was just found (the schema is in supabase.sql)
+        try:
+            self.supabase.table('career_pages') \
+                .upsert(rows, on_conflict='company_name_norm') \
+                .execute()
+        except Exception as e:
+            logger.warning("Career page cache write error: %s", e)
+
+        with self._mem_cache_lock:
+            for row in rows:
+                self._mem_cache[row['company_name_norm']] = self._row_to_result(row)
 
     def get_cache_stats(self) -> Dict:
         """Get statistics about cached entries"""
-        # Get total count
-        total_result = self.supabase.table('career_pages') \
-            .select('*', count='exact') \
-            .execute()
-
-        total_entries = total_result.count
-
-        # Get source breakdown - need to use RPC or aggregate in Python
-        # Option 1: Fetch all and group in Python
-        source_result = self.supabase.table('career_pages') \
-            .select('source') \
-            .execute()
+        # Grouped in the database by the career_pages_source_counts function:
+        #   SELECT source, COUNT(*) AS count FROM career_pages GROUP BY source
+        # Every row falls in exactly one group, so the counts also sum to the total
+        source_result = self.supabase.rpc('career_pages_source_counts').execute()
 
-        source_breakdown = {}
-        for row in source_result.data:
-            source = row['source']
-            source_breakdown[source] = source_breakdown.get(source, 0) + 1
+        source_breakdown = {row['source']: row['count'] for row in source_result.data}
 
         return {
-            'total_entries': total_entries,
+            'total_entries': sum(source_breakdown.values()),
             'source_breakdown': source_breakdown
         }
 
@@ -370,8 +711,8 @@ class EnhancedCareerPageFinder:
 #         "Tesla Inc"
 #     ]
 #
-#     for company in test_companies:
-#         result = finder.find_career_page(company)
+#     results = finder.find_career_pages(test_companies)
+#     for company, result in results.items():
 #         if result:
 #             print(f"✅ {company}")
 #             print(f"   Domain: {result['domain']}")
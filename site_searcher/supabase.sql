@@ -0,0 +1,65 @@
+-- Supabase (Postgres) objects used by EnhancedCareerPageFinder.
+-- Statements are idempotent, so the file can be re-run on an existing project.
+
+-- Career page cache, looked up by normalized company name: suffixes such as
+-- Inc removed, trimmed and lowercased (EnhancedCareerPageFinder._normalize_company_name)
+CREATE TABLE IF NOT EXISTS career_pages (
+    id BIGSERIAL PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    company_name_norm TEXT,
+    company_domain TEXT,
+    career_url TEXT,
+    source TEXT,
+    confidence_score INTEGER,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    last_verified TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Migration for tables created before company_name_norm existed
+ALTER TABLE career_pages ADD COLUMN IF NOT EXISTS company_name_norm TEXT;
+
+-- Backfill with the same normalization as _clean_company_name(...).strip().lower()
+UPDATE career_pages
+SET company_name_norm = lower(regexp_replace(
+    regexp_replace(company_name, '(\y(Inc\.?|LLC|Corp\.?|Corporation|Ltd|Limited|Co)\y\s*)+$', '', 'i'),
+    '^\s+|\s+$', '', 'g'
+))
+WHERE company_name_norm IS NULL;
+
+-- Names that only differed by case or suffix now share a key; keep the most
+-- recently verified row of each
+DELETE FROM career_pages a
+USING career_pages b
+WHERE a.company_name_norm = b.company_name_norm
+  AND (a.last_verified, a.id) < (b.last_verified, b.id);
+
+ALTER TABLE career_pages ALTER COLUMN company_name_norm SET NOT NULL;
+
+-- The upsert conflicts on company_name_norm; the old unique company_name
+-- constraint would reject a new row for a name already stored in another form
+ALTER TABLE career_pages DROP CONSTRAINT IF EXISTS career_pages_company_name_key;
+CREATE UNIQUE INDEX IF NOT EXISTS career_pages_company_name_norm_key
+    ON career_pages (company_name_norm);
+
+-- Clearbit company -> domain answers, kept longer than career pages
+CREATE TABLE IF NOT EXISTS company_domains (
+    company_name_norm TEXT PRIMARY KEY,
+    company_domain TEXT NOT NULL,
+    last_verified TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Per-source entry counts for get_cache_stats, aggregated in the database
+CREATE OR REPLACE FUNCTION career_pages_source_counts()
+RETURNS TABLE (source TEXT, count BIGINT)
+LANGUAGE sql STABLE AS $$
+    SELECT source, COUNT(*) FROM career_pages GROUP BY source
+$$;
+
+-- Google CSE responses keyed by a blake2b hash of the request, with the
+-- ETag used to revalidate them once stale
+CREATE TABLE IF NOT EXISTS google_cse_cache (
+    query_hash TEXT PRIMARY KEY,
+    etag TEXT,
+    items JSONB,
+    fetched_at TIMESTAMPTZ NOT NULL
+);
@@ -0,0 +1,43 @@
+"""Tests for /analyze/batch, run without Redis, NLP models or network access"""
+from fastapi.testclient import TestClient
+
+import app as app_module
+from known_sites.base_parsers import JobParserFactory
+from schema import JobAnalysisResponse
+
+
+class StubAnalyzer:
+    """Stands in for JobAnalyzer so no spaCy or KeyBERT models are loaded"""
+
+    def analyze(self, content, url=None):
+        return JobAnalysisResponse(
+            success=True,
+            company_name=None,
+            companyUrl=None,
+            job_title="Engineer",
+            keywords=[],
+            skills=[],
+            experience_level=None,
+            additional_details={},
+            confidence_scores={},
+        )
+
+
+def test_batch_reports_invalid_url_per_posting(monkeypatch):
+    monkeypatch.setattr(app_module, "redis_client", None)
+    monkeypatch.setattr(app_module, "analyzer", StubAnalyzer())
+    monkeypatch.setattr(app_module, "parser_factory", JobParserFactory())
+    app_module.local_cache.clear()
+
+    # No context manager, so the lifespan (Redis, Supabase) never runs
+    client = TestClient(app_module.app)
+    response = client.post("/analyze/batch", json={"postings": [
+        {"content": "Staff engineer role " * 10, "url": "http://[oops", "rawHTML": "<html></html>"},
+        {"content": "Backend engineer role " * 10, "url": "https://example.com/jobs/1"},
+    ]})
+
+    assert response.status_code == 200
+    bad, good = response.json()["results"]
+    assert bad == {"success": False, "status_code": 400, "error": "Invalid URL"}
+    assert good["success"] is True
+    assert good["job_title"] == "Engineer"